@@ -1,9 +1,13 @@
 """Exporters for writing formatted content to various destinations."""
 
+import io
 import logging
+import os
+from collections.abc import Buffer
 from pathlib import Path
+from typing import BinaryIO
 
-from parade.application.export import Exporter
+from parade.application.export import ContentWriter, Exporter
 
 __all__ = ["FileExporter", "FileSizeLimitExceededError", "PathTraversalError"]
 
@@ -20,13 +24,17 @@ class PathTraversalError(ValueError):
             attempted_path: The path that was rejected.
             allowed_base: The base directory that paths must be within.
         """
-        super().__init__(
-            f"Path '{attempted_path}' is outside allowed base directory '{allowed_base}'. "
-            "Path traversal attempts are not permitted."
-        )
+        super().__init__(attempted_path, allowed_base)
         self.attempted_path = attempted_path
         self.allowed_base = allowed_base
 
+    def __str__(self) -> str:
+        """Build the error message on demand rather than on every raise."""
+        return (
+            f"Path '{self.attempted_path}' is outside allowed base directory '{self.allowed_base}'. "
+            "Path traversal attempts are not permitted."
+        )
+
 
 class FileSizeLimitExceededError(ValueError):
     """Raised when attempting to write content that exceeds the maximum allowed file size."""
@@ -38,13 +46,90 @@ class FileSizeLimitExceededError(ValueError):
             content_size: The size of the content attempting to be written (in bytes).
             max_size: The maximum allowed file size (in bytes).
         """
-        super().__init__(
-            f"Content size ({content_size:,} bytes) exceeds maximum allowed file size ({max_size:,} bytes). "
-            "This limit prevents disk exhaustion attacks."
-        )
+        super().__init__(content_size, max_size)
         self.content_size = content_size
         self.max_size = max_size
 
+    def __str__(self) -> str:
+        """Build the error message on demand rather than on every raise."""
+        return (
+            f"Content size ({self.content_size:,} bytes) exceeds maximum allowed file size ({self.max_size:,} bytes). "
+            "This limit prevents disk exhaustion attacks."
+        )
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry to disk so a newly created or renamed file persists.
+
+    Only POSIX systems let a directory be opened and fsynced. Elsewhere, such as on
+    Windows, this does nothing and only the file's own data is flushed.
+    """
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _SizeLimitedWriter(io.RawIOBase):
+    """Raw binary stream that enforces a byte budget on an underlying file.
+
+    Used when streaming, where the total size is only known once the writer is done.
+    After the limit has been hit, or the export has been aborted, further writes are
+    discarded so that closing the buffered layers during error unwinding does not
+    raise again and mask the original error.
+    """
+
+    def __init__(self, file: BinaryIO, max_size: int) -> None:
+        """Wrap an open binary file.
+
+        Args:
+            file: Unbuffered binary file to write to. Closed together with this stream.
+            max_size: Maximum number of bytes that may be written.
+        """
+        self._file = file
+        self._max_size = max_size
+        self._written = 0
+        self._discarding = False
+
+    def writable(self) -> bool:
+        """Report that this stream supports writing."""
+        return True
+
+    def fileno(self) -> int:
+        """Return the file descriptor of the underlying file."""
+        return self._file.fileno()
+
+    def write(self, data: Buffer, /) -> int:
+        """Write data to the underlying file unless it would exceed the size limit.
+
+        Raises:
+            FileSizeLimitExceededError: If the total written would exceed the limit.
+        """
+        chunk = memoryview(data)
+        if self._discarding:
+            return chunk.nbytes
+        if self._written + chunk.nbytes > self._max_size:
+            self._discarding = True
+            raise FileSizeLimitExceededError(self._written + chunk.nbytes, self._max_size)
+        # Count only what the file accepted: after a short write the buffered layer
+        # resends the remainder, which must not be counted twice
+        written = self._file.write(chunk)
+        self._written += written
+        return written
+
+    def abort(self) -> None:
+        """Discard all further writes, including data still buffered by outer layers."""
+        self._discarding = True
+
+    def close(self) -> None:
+        """Close this stream and the underlying file."""
+        if not self.closed:
+            self._file.close()
+        super().close()
+
 
 class FileExporter(Exporter):
     """Exporter that writes content to files with security constraints.
@@ -52,22 +137,34 @@ class FileExporter(Exporter):
     Security features:
     - Path traversal protection: All paths must be within allowed_base_dir
     - File size limits: Prevents disk exhaustion by limiting max file size
-    - Atomic writes: Uses temp file + rename to prevent corruption
+    - Atomic writes: Uses temp file + rename to prevent corruption when overwriting
     - Parent directory creation: Automatically creates missing parent directories
+    - Optional durability: With fsync enabled, file data and (on POSIX systems)
+      the directory entry are flushed to disk before export returns
 
-    Note: Currently only supports string content. In the future, we may need to
-    support other content types (bytes, structured data, etc.) for different
-    export formats.
+    Content may be a string or already UTF-8 encoded bytes. In the future, we may
+    need to support structured data for different export formats.
     """
 
     # Default maximum file size: 100MB
     # This is generous for JSON/text exports but prevents abuse
     DEFAULT_MAX_FILE_SIZE_BYTES = 100 * 1024 * 1024
 
+    # Content up to one filesystem block is written straight to a new target file.
+    # There is no previous version to protect, so the temp file + rename buys nothing
+    # beyond guarding a partially written *new* file, which we remove on failure anyway.
+    SMALL_WRITE_THRESHOLD_BYTES = 4096
+
+    # Write buffer for streamed exports; large enough that a typical export is a
+    # handful of write() syscalls rather than one per formatter chunk.
+    STREAM_BUFFER_SIZE_BYTES = 64 * 1024
+
     def __init__(
         self,
         allowed_base_dir: Path,
         max_file_size_bytes: int = DEFAULT_MAX_FILE_SIZE_BYTES,
+        *,
+        fsync: bool = False,
     ) -> None:
         """Initialize the file exporter with security constraints.
 
@@ -75,15 +172,24 @@ class FileExporter(Exporter):
             allowed_base_dir: Base directory that all exported files must be within.
                             This prevents path traversal attacks.
             max_file_size_bytes: Maximum allowed file size in bytes. Defaults to 100MB.
+            fsync: Whether to fsync the written file and its parent directory so the
+                  export survives a power loss. The directory is only flushed on POSIX
+                  systems. Defaults to False, since rename alone already prevents torn
+                  files and fsync is by far the slowest step.
         """
         self.allowed_base_dir = allowed_base_dir.resolve()
         self.max_file_size_bytes = max_file_size_bytes
+        self.fsync = fsync
+        # Precomputed string forms for the containment check in export()
+        self._base_dir_str = str(self.allowed_base_dir)
+        self._base_dir_prefix = self._base_dir_str.rstrip(os.sep) + os.sep
 
-    def export(self, content: str, path: Path) -> Path:
+    def export(self, content: str | bytes, path: Path) -> Path:
         """Write content to a file with security and reliability safeguards.
 
         Args:
-            content: The formatted content to write.
+            content: The formatted content to write. Bytes are written as-is and
+                    are expected to be UTF-8 encoded already.
             path: File path where content should be written. Must be within
                  the allowed base directory.
 
@@ -97,10 +203,104 @@ class FileExporter(Exporter):
         """
         logger.debug("Starting file export to %s", path)
 
-        # Check file size limit before attempting to write
-        content_bytes = content.encode("utf-8")
+        content_bytes = content if isinstance(content, bytes) else content.encode("utf-8")
         content_size = len(content_bytes)
 
+        # Check file size limit before attempting to write, on the encoded size
+        self._check_size(content_size)
+
+        absolute_path = self._prepare_target(path)
+
+        if content_size <= self.SMALL_WRITE_THRESHOLD_BYTES and self._write_new_file(absolute_path, content_bytes):
+            logger.info("Successfully exported %d bytes to %s", content_size, absolute_path)
+            return absolute_path
+
+        # Atomic write: write to temp file, then rename
+        # This prevents corruption if the process crashes during write
+        temp_path = absolute_path.with_suffix(absolute_path.suffix + ".tmp")
+
+        try:
+            with temp_path.open("wb") as temp_file:
+                temp_file.write(content_bytes)
+                if self.fsync:
+                    os.fsync(temp_file.fileno())
+            temp_path.replace(absolute_path)  # Atomic on POSIX systems
+            if self.fsync:
+                _fsync_directory(absolute_path.parent)
+            logger.info("Successfully exported %d bytes to %s", content_size, absolute_path)
+        except OSError:
+            logger.exception("Failed to write file %s", absolute_path)
+            # Clean up temp file on any error
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        return absolute_path
+
+    def export_stream(self, write: ContentWriter, path: Path) -> Path:
+        """Stream content straight into a file with the same safeguards as export.
+
+        The writer's output is encoded and written to the temporary file as it is
+        produced, so the full content never has to exist in memory. The size limit
+        is enforced while streaming.
+
+        Args:
+            write: Callable that writes the formatted content to a text stream.
+            path: File path where content should be written. Must be within
+                 the allowed base directory.
+
+        Returns:
+            The absolute path where the file was written.
+
+        Raises:
+            PathTraversalError: If the path attempts to escape allowed_base_dir.
+            FileSizeLimitExceededError: If content exceeds max_file_size_bytes. The
+                reported content size is the number of bytes produced up to that point.
+            OSError: If file operations fail (permission denied, disk full, etc).
+        """
+        logger.debug("Starting streamed file export to %s", path)
+
+        absolute_path = self._prepare_target(path)
+        temp_path = absolute_path.with_suffix(absolute_path.suffix + ".tmp")
+
+        try:
+            raw = _SizeLimitedWriter(temp_path.open("wb", buffering=0), self.max_file_size_bytes)
+            buffered = io.BufferedWriter(raw, buffer_size=self.STREAM_BUFFER_SIZE_BYTES)
+            with io.TextIOWrapper(buffered, encoding="utf-8", newline="") as stream:
+                try:
+                    write(stream)
+                except BaseException:
+                    # Closing the stream flushes what the writer buffered; drop it so
+                    # a size-limit error from that flush cannot replace this one
+                    raw.abort()
+                    raise
+                stream.flush()
+                if self.fsync:
+                    os.fsync(raw.fileno())
+            temp_path.replace(absolute_path)  # Atomic on POSIX systems
+            if self.fsync:
+                _fsync_directory(absolute_path.parent)
+            logger.info("Successfully exported stream to %s", absolute_path)
+        except FileSizeLimitExceededError:
+            logger.warning("File size limit exceeded while streaming to %s", absolute_path)
+            temp_path.unlink(missing_ok=True)
+            raise
+        except Exception:
+            logger.exception("Failed to write file %s", absolute_path)
+            # Clean up temp file on any error, including ones raised by the writer
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        return absolute_path
+
+    def _check_size(self, content_size: int) -> None:
+        """Reject content whose size exceeds the configured limit.
+
+        Args:
+            content_size: Size of the content to be written.
+
+        Raises:
+            FileSizeLimitExceededError: If content_size exceeds max_file_size_bytes.
+        """
         if content_size > self.max_file_size_bytes:
             logger.warning(
                 "File size limit exceeded: %d bytes > %d bytes max",
@@ -109,10 +309,25 @@ class FileExporter(Exporter):
             )
             raise FileSizeLimitExceededError(content_size, self.max_file_size_bytes)
 
-        # Resolve to absolute path and validate it's within allowed directory
-        absolute_path = path.resolve()
+    def _prepare_target(self, path: Path) -> Path:
+        """Validate the target path and create its parent directories.
+
+        Args:
+            path: Requested file path.
 
-        if not absolute_path.is_relative_to(self.allowed_base_dir):
+        Returns:
+            The resolved absolute path.
+
+        Raises:
+            PathTraversalError: If the path attempts to escape allowed_base_dir.
+        """
+        # Resolve to absolute path and validate it's within allowed directory.
+        # realpath + a string prefix check avoids the per-component PurePath work
+        # that Path.resolve() and Path.is_relative_to() do on top of the lstat calls.
+        resolved = os.path.realpath(os.fspath(path))
+        absolute_path = Path(resolved)
+
+        if resolved != self._base_dir_str and not resolved.startswith(self._base_dir_prefix):
             logger.warning(
                 "Path traversal attempt blocked: %s outside %s",
                 absolute_path,
@@ -122,21 +337,41 @@ class FileExporter(Exporter):
 
         # Ensure parent directory exists
         absolute_path.parent.mkdir(parents=True, exist_ok=True)
-        logger.debug("Created parent directories for %s", absolute_path)
 
-        # Atomic write: write to temp file, then rename
-        # This prevents corruption if the process crashes during write
-        temp_path = absolute_path.with_suffix(absolute_path.suffix + ".tmp")
+        return absolute_path
+
+    def _write_new_file(self, path: Path, content_bytes: bytes) -> bool:
+        """Write small content directly to a file that does not exist yet.
+
+        This trades crash safety for fewer syscalls: a crash mid-write can leave a
+        truncated new file, but an existing file is never touched. Existing targets
+        always go through the atomic temp file + rename path.
+
+        Args:
+            path: Absolute target path.
+            content_bytes: Encoded content to write.
 
+        Returns:
+            True if the file was created and written, False if it already existed.
+
+        Raises:
+            OSError: If file operations fail (permission denied, disk full, etc).
+        """
         try:
-            logger.debug("Writing %d bytes to temporary file %s", content_size, temp_path)
-            temp_path.write_bytes(content_bytes)  # Use write_bytes since we already encoded
-            temp_path.replace(absolute_path)  # Atomic on POSIX systems
-            logger.info("Successfully exported %d bytes to %s", content_size, absolute_path)
+            file = path.open("xb")
+        except FileExistsError:
+            return False
+
+        try:
+            with file:
+                file.write(content_bytes)
+                if self.fsync:
+                    os.fsync(file.fileno())
+            if self.fsync:
+                _fsync_directory(path.parent)
         except OSError:
-            logger.exception("Failed to write file %s", absolute_path)
-            # Clean up temp file on any error
-            temp_path.unlink(missing_ok=True)
+            logger.exception("Failed to write file %s", path)
+            path.unlink(missing_ok=True)
             raise
 
-        return absolute_path
+        return True
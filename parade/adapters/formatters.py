@@ -1,9 +1,12 @@
 """Formatters for converting project networks to various output formats."""
 
-import json
 import logging
+from collections.abc import Iterator
+from json.encoder import encode_basestring_ascii
+from typing import TextIO
 
 from parade.application.format import ProjectFormatter
+from parade.domain.activity import ScheduledActivity
 from parade.domain.project_network import ScheduledProjectNetwork
 
 __all__ = ["JSONFormatter"]
@@ -12,7 +15,14 @@ logger = logging.getLogger(__name__)
 
 
 class JSONFormatter(ProjectFormatter):
-    """Formatter that converts project networks to JSON."""
+    """Formatter that converts project networks to JSON.
+
+    The output matches json.dumps(..., indent=2) of the equivalent dictionary, but
+    is emitted as precomputed fragments instead of building an intermediate dict
+    per activity. Decimal values never need escaping, so they are inlined as-is;
+    only activity names need escaping, and they are passed straight to the C string
+    encoder that json.dumps itself uses for str values.
+    """
 
     def format(self, network: ScheduledProjectNetwork) -> str:
         """Convert project network to JSON string.
@@ -25,23 +35,52 @@ class JSONFormatter(ProjectFormatter):
         """
         logger.debug("Starting JSON formatting for network with %d activities", len(network.activities))
 
-        data = {
-            "project_duration": str(network.project_duration.value),
-            "activities": [
-                {
-                    "name": activity.name.value,
-                    "duration": str(activity.duration.value),
-                    "dependencies": [dep.value for dep in activity.dependencies],
-                    "earliest_start": str(activity.earliest_start.value),
-                    "earliest_finish": str(activity.earliest_finish.value),
-                    "latest_start": str(activity.latest_start.value),
-                    "latest_finish": str(activity.latest_finish.value),
-                    "total_float": str(activity.total_float.value),
-                    "is_critical": activity.is_critical,
-                }
-                for activity in network.activities
-            ],
-        }
-        result = json.dumps(data, indent=2)
+        result = "".join(self._iter_fragments(network))
         logger.info("Formatted network as JSON: %d characters", len(result))
         return result
+
+    def write_to(self, network: ScheduledProjectNetwork, stream: TextIO) -> None:
+        """Stream project network JSON to a text stream without building the full string.
+
+        Args:
+            network: The scheduled project network to format.
+            stream: Text stream to write the JSON to.
+        """
+        logger.debug("Starting JSON streaming for network with %d activities", len(network.activities))
+
+        stream.writelines(self._iter_fragments(network))
+        logger.info("Streamed network as JSON")
+
+    @classmethod
+    def _iter_fragments(cls, network: ScheduledProjectNetwork) -> Iterator[str]:
+        """Yield the JSON document for a project network piece by piece."""
+        yield f'{{\n  "project_duration": "{network.project_duration.value}",\n  "activities": ['
+        separator = "\n"
+        for activity in network.activities:
+            yield separator
+            yield cls._format_activity(activity)
+            separator = ",\n"
+        # json.dumps renders an empty list as "[]" rather than an indented block
+        yield "]\n}" if separator == "\n" else "\n  ]\n}"
+
+    @staticmethod
+    def _format_activity(activity: ScheduledActivity) -> str:
+        """Render a single activity as an indented JSON object."""
+        if activity.dependencies:
+            dependency_items = ",\n        ".join([encode_basestring_ascii(dep.value) for dep in activity.dependencies])
+            dependencies = f"[\n        {dependency_items}\n      ]"
+        else:
+            dependencies = "[]"
+        return (
+            "    {\n"
+            f'      "name": {encode_basestring_ascii(activity.name.value)},\n'
+            f'      "duration": "{activity.duration.value}",\n'
+            f'      "dependencies": {dependencies},\n'
+            f'      "earliest_start": "{activity.earliest_start.value}",\n'
+            f'      "earliest_finish": "{activity.earliest_finish.value}",\n'
+            f'      "latest_start": "{activity.latest_start.value}",\n'
+            f'      "latest_finish": "{activity.latest_finish.value}",\n'
+            f'      "total_float": "{activity.total_float.value}",\n'
+            f'      "is_critical": {"true" if activity.is_critical else "false"}\n'
+            "    }"
+        )
@@ -1,10 +1,15 @@
 """Application layer for exporting formatted content to different destinations."""
 
+import io
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from enum import StrEnum, auto
 from pathlib import Path
+from typing import TextIO
 
-__all__ = ["ExportDestination", "Exporter", "export_to"]
+__all__ = ["ContentWriter", "ExportDestination", "Exporter", "export_to"]
+
+type ContentWriter = Callable[[TextIO], object]
 
 
 class ExportDestination(StrEnum):
@@ -17,25 +22,43 @@ class Exporter(ABC):
     """Abstract base class for exporting formatted content to specific destinations."""
 
     @abstractmethod
-    def export(self, content: str, path: Path) -> Path:
+    def export(self, content: str | bytes, path: Path) -> Path:
         """Export the formatted content to the target destination.
 
         Args:
-            content: The formatted content to export.
+            content: The formatted content to export. Bytes are taken to be UTF-8 encoded.
+            path: Path/location for the export. Interpretation depends on destination.
+
+        Returns:
+            Path where the content was exported.
+        """
+
+    def export_stream(self, write: ContentWriter, path: Path) -> Path:
+        """Export content produced by a writer callable.
+
+        The default implementation buffers the writer's output in memory and
+        passes it to export. Exporters that can stream should override this so
+        the full content never has to be held in memory.
+
+        Args:
+            write: Callable that writes the formatted content to a text stream.
             path: Path/location for the export. Interpretation depends on destination.
 
         Returns:
             Path where the content was exported.
         """
+        buffer = io.StringIO()
+        write(buffer)
+        return self.export(buffer.getvalue(), path)
 
 
-def export_to(exporter: Exporter, path: Path, content: str) -> Path:
+def export_to(exporter: Exporter, path: Path, content: str | bytes) -> Path:
     """Export formatted content using the provided exporter.
 
     Args:
         exporter: The exporter implementation to use.
         path: Path/location for the export.
-        content: The formatted content to export.
+        content: The formatted content to export. Bytes are taken to be UTF-8 encoded.
 
     Returns:
         Path where the content was exported.
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from enum import StrEnum, auto
+from typing import TextIO
 
 from parade.domain.project_network import ScheduledProjectNetwork
 
@@ -28,6 +29,33 @@ class ProjectFormatter(ABC):
             String representation in the target format.
         """
 
+    def format_bytes(self, network: ScheduledProjectNetwork) -> bytes:
+        """Format the project network into UTF-8 encoded bytes.
+
+        Exporters accept bytes directly, so this lets callers encode once at the
+        formatter boundary. Formatters that can produce bytes natively should
+        override this.
+
+        Args:
+            network: The scheduled project network to format.
+
+        Returns:
+            UTF-8 encoded representation in the target format.
+        """
+        return self.format(network).encode("utf-8")
+
+    def write_to(self, network: ScheduledProjectNetwork, stream: TextIO) -> None:
+        """Write the formatted project network to a text stream.
+
+        The default implementation writes the result of format in one call.
+        Formatters that can emit output incrementally should override this.
+
+        Args:
+            network: The scheduled project network to format.
+            stream: Text stream to write the formatted output to.
+        """
+        stream.write(self.format(network))
+
 
 def format_as(formatter: ProjectFormatter, network: ScheduledProjectNetwork) -> str:
     """Format a project network using the provided formatter.
@@ -1,13 +1,15 @@
 """Activity domain model for Critical Path Method."""
 
+import functools
 from dataclasses import InitVar, dataclass, field
 from decimal import Decimal
+from operator import attrgetter
 from typing import Self
 
 type DecimalConvertible = int | str | Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivityName:
     """Value object representing an activity name."""
 
@@ -31,8 +33,18 @@ class ActivityName:
         """Return hash based on value."""
         return hash(self.value)
 
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def get(cls, value: str) -> Self:
+        """Return a shared ActivityName for a string, validating it only once.
+
+        ActivityName is frozen and compares by value, so callers that refer to
+        the same name can safely share a single instance.
+        """
+        return cls(value)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class Duration:
     """Value object representing the duration of an activity in abstract time units."""
 
@@ -53,18 +65,28 @@ class Duration:
             msg = "Duration cannot be negative"
             raise ValueError(msg)
 
-        # Create instance with normalized Decimal value
+        return cls._from_validated(decimal_value)
+
+    @classmethod
+    def _from_validated(cls, value: Decimal) -> Self:
+        """Create an instance from a Decimal already known to be finite and non-negative."""
         instance = object.__new__(cls)
-        object.__setattr__(instance, "value", decimal_value)
+        object.__setattr__(instance, "value", value)
         return instance
 
     def __add__(self, other: Self) -> Duration:
         """Add two durations together."""
-        return Duration(self.value + other.value)
+        # The sum of two finite, non-negative values is finite and non-negative,
+        # so the checks in __new__ can be skipped
+        return Duration._from_validated(self.value + other.value)
 
     def __sub__(self, other: Self) -> Duration:
         """Subtract one duration from another."""
-        return Duration(self.value - other.value)
+        difference = self.value - other.value
+        if difference < 0:
+            msg = "Duration cannot be negative"
+            raise ValueError(msg)
+        return Duration._from_validated(difference)
 
     def __lt__(self, other: Self) -> bool:
         """Check if this duration is less than another."""
@@ -83,7 +105,7 @@ class Duration:
         return self.value >= other.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class Float(Duration):
     """Value object representing the slack time available for an activity.
 
@@ -97,7 +119,7 @@ class Float(Duration):
         return cls(duration.value)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Activity:
     """Base class for all activities with core attributes.
 
@@ -108,26 +130,29 @@ class Activity:
 
     The depends_on parameter accepts strings or ActivityName objects for convenience,
     which are automatically converted to ActivityName objects and stored in dependencies.
+    Dependencies are kept as a tuple ordered by name: activities rarely have more
+    than a handful, so a tuple is smaller than a frozenset while still giving
+    output a stable order without sorting on every use.
     """
 
     name: ActivityName
     duration: Duration
     depends_on: InitVar[frozenset[str | ActivityName] | None] = None
-    dependencies: frozenset[ActivityName] = field(init=False, default_factory=frozenset)
+    dependencies: tuple[ActivityName, ...] = field(init=False, default=())
 
     def __post_init__(self, depends_on: frozenset[str | ActivityName] | None) -> None:
         """Convert string dependencies to ActivityName."""
         if depends_on is None:
             depends_on = frozenset()
-        converted_deps = frozenset(ActivityName(dep) if isinstance(dep, str) else dep for dep in depends_on)
-        object.__setattr__(self, "dependencies", converted_deps)
+        converted_deps = {ActivityName.get(dep) if isinstance(dep, str) else dep for dep in depends_on}
+        object.__setattr__(self, "dependencies", tuple(sorted(converted_deps, key=attrgetter("value"))))
 
     def has_dependency(self, activity_name: ActivityName) -> bool:
         """Check if this activity depends on another activity."""
         return activity_name in self.dependencies
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UnscheduledActivity(Activity):
     """Value object representing a project activity before scheduling.
 
@@ -135,30 +160,62 @@ class UnscheduledActivity(Activity):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ScheduledActivity(Activity):
     """Value object representing a scheduled activity with calculated timings.
 
     Includes all core activity attributes plus:
     - Earliest start and finish times (from forward pass)
     - Latest start and finish times (from backward pass)
-    - Calculated float
+    - Calculated float, and whether that puts the activity on the critical path
+
+    The float and criticality are derived from the times once, when the activity
+    is created, and stored alongside them.
     """
 
     earliest_start: Duration
     earliest_finish: Duration
     latest_start: Duration
     latest_finish: Duration
+    total_float: Float = field(init=False, repr=False, compare=False)
+    is_critical: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def total_float(self) -> Float:
-        """Calculate the total float for this activity.
+    def __post_init__(self, depends_on: frozenset[str | ActivityName] | None) -> None:
+        """Convert string dependencies to ActivityName and derive the float."""
+        Activity.__post_init__(self, depends_on)
+        self._set_float()
 
-        Total Float = Latest Start - Earliest Start
+    @classmethod
+    def from_activity(
+        cls,
+        activity: Activity,
+        *,
+        earliest_start: Duration,
+        earliest_finish: Duration,
+        latest_start: Duration,
+        latest_finish: Duration,
+    ) -> Self:
+        """Create a scheduled activity from an existing activity and its calculated times.
+
+        The activity's dependencies were already converted when it was created, so
+        they are reused as-is instead of running __post_init__ again.
         """
-        return Float.from_duration(self.latest_start - self.earliest_start)
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "name", activity.name)
+        object.__setattr__(instance, "duration", activity.duration)
+        object.__setattr__(instance, "dependencies", activity.dependencies)
+        object.__setattr__(instance, "earliest_start", earliest_start)
+        object.__setattr__(instance, "earliest_finish", earliest_finish)
+        object.__setattr__(instance, "latest_start", latest_start)
+        object.__setattr__(instance, "latest_finish", latest_finish)
+        instance._set_float()
+        return instance
+
+    def _set_float(self) -> None:
+        """Store the total float and criticality for the activity's times.
 
-    @property
-    def is_critical(self) -> bool:
-        """Check if this activity is on the critical path (zero float)."""
-        return self.total_float.value == 0
+        Total Float = Latest Start - Earliest Start; zero float means critical.
+        """
+        total_float = Float(self.latest_start.value - self.earliest_start.value)
+        object.__setattr__(self, "total_float", total_float)
+        object.__setattr__(self, "is_critical", total_float.value == 0)
@@ -1,7 +1,9 @@
 """Project network domain models for Critical Path Method."""
 
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TypeVar
 
 from parade.domain.activity import (
@@ -15,69 +17,88 @@ from parade.domain.activity import (
 ActivityT = TypeVar("ActivityT", bound=Activity)
 
 
-def _validate_not_empty(activities: Iterable[Activity]) -> None:
+def _validate_not_empty(activities: Sequence[Activity]) -> None:
     """Ensure the network has at least one activity."""
-    # Convert to list to check if empty (iterables might be consumed)
-    activities_list = list(activities)
-    if not activities_list:
+    if not activities:
         msg = "Project network must contain at least one activity"
         raise ValueError(msg)
 
 
-def _validate_unique_names(activities: Iterable[Activity]) -> None:
-    """Ensure all activity names are unique."""
-    names = [activity.name for activity in activities]
-    if len(names) != len(set(names)):
+def _index_unique_names(activities: Sequence[Activity]) -> dict[ActivityName, int]:
+    """Ensure all activity names are unique and map each name to its position."""
+    index_by_name = {activity.name: index for index, activity in enumerate(activities)}
+    if len(index_by_name) != len(activities):
         msg = "Activity names must be unique"
         raise ValueError(msg)
+    return index_by_name
 
 
-def _validate_dependencies_exist(activities: Iterable[Activity]) -> None:
-    """Ensure all dependency references point to existing activities."""
-    activities_list = list(activities)
-    activity_names = {activity.name for activity in activities_list}
-    for activity in activities_list:
-        for dependency_name in activity.dependencies:
-            if dependency_name not in activity_names:
-                msg = f"Activity {activity.name.value} depends on non-existent activity {dependency_name.value}"
-                raise ValueError(msg)
-
+@dataclass(frozen=True, slots=True)
+class DependencyGraph:
+    """Integer form of a network's dependencies, built once during validation.
 
-def _validate_no_cycles(activities: Iterable[Activity]) -> None:
-    """Ensure the dependency graph has no cycles."""
-    # Build adjacency list for DFS
-    graph: dict[ActivityName, set[ActivityName]] = {
-        activity.name: set(activity.dependencies) for activity in activities
-    }
-
-    # Track visited nodes and nodes in current path
-    visited: set[ActivityName] = set()
-    in_path: set[ActivityName] = set()
+    Activities are referred to by their position in ProjectNetwork.activities:
+    - order lists positions topologically, every activity after its dependencies
+    - predecessors[i] holds the positions activity i depends on
+    - successors[i] holds the positions of the activities that depend on activity i
+    """
 
-    def has_cycle(node: ActivityName) -> bool:
-        """Perform DFS to detect cycles."""
-        if node in in_path:
-            return True
-        if node in visited:
-            return False
+    order: tuple[int, ...]
+    predecessors: tuple[tuple[int, ...], ...]
+    successors: tuple[tuple[int, ...], ...]
 
-        visited.add(node)
-        in_path.add(node)
 
-        for dependency in graph.get(node, set()):
-            if has_cycle(dependency):
-                return True
+def _build_dependency_graph(
+    activities: Sequence[Activity],
+    index_by_name: Mapping[ActivityName, int],
+) -> DependencyGraph:
+    """Ensure all dependency references exist and the dependency graph has no cycles.
 
-        in_path.remove(node)
-        return False
+    Builds the integer dependency lists while checking that each dependency exists,
+    then runs Kahn's algorithm: repeatedly remove activities whose dependencies have
+    all been removed. Any activity left over is part of a cycle. Iterative, so long
+    dependency chains cannot hit the recursion limit.
 
-    for activity_name in graph:
-        if has_cycle(activity_name):
-            msg = "Project network contains circular dependencies"
-            raise ValueError(msg)
+    Returns:
+        The validated dependency graph, including the order Kahn's algorithm
+        removed activities in.
+    """
+    predecessors: list[tuple[int, ...]] = []
+    # successors[i] lists the activities that depend on activity i
+    successors: list[list[int]] = [[] for _ in activities]
+    for index, activity in enumerate(activities):
+        dependency_indices = []
+        for dependency in activity.dependencies:
+            dependency_index = index_by_name.get(dependency)
+            if dependency_index is None:
+                msg = f"Activity {activity.name.value} depends on non-existent activity {dependency.value}"
+                raise ValueError(msg)
+            successors[dependency_index].append(index)
+            dependency_indices.append(dependency_index)
+        predecessors.append(tuple(dependency_indices))
+
+    in_degree = [len(dependency_indices) for dependency_indices in predecessors]
+    ready = deque(index for index, degree in enumerate(in_degree) if degree == 0)
+    order: list[int] = []
+    while ready:
+        index = ready.popleft()
+        order.append(index)
+        for successor in successors[index]:
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                ready.append(successor)
+
+    if len(order) != len(activities):
+        msg = "Project network contains circular dependencies"
+        raise ValueError(msg)
+    return DependencyGraph(
+        order=tuple(order),
+        predecessors=tuple(predecessors),
+        successors=tuple(map(tuple, successors)),
+    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ProjectNetwork[ActivityT]:
     """Generic base class for validated project networks.
 
@@ -88,24 +109,73 @@ class ProjectNetwork[ActivityT]:
     - No circular dependencies exist
 
     Type parameter ActivityT ensures type safety for the specific activity type.
+
+    Activities are stored as a tuple in the order they were given, alongside an
+    index from activity name to position for constant-time lookup by name.
+    The dependency graph built while checking for cycles, including its topological
+    order, is kept as well, so scheduling can sweep the network without searching
+    it again.
+
+    Equality and hashing depend only on which activities the network holds, not on
+    the order they were given in.
     """
 
-    activities: frozenset[ActivityT]
+    activities: tuple[ActivityT, ...]
+    dependency_graph: DependencyGraph = field(init=False, repr=False, compare=False)
+    _index_by_name: dict[ActivityName, int] = field(init=False, repr=False, compare=False)
 
     def __init__(self, activities: Iterable[Activity]) -> None:
         """Create and validate a project network.
 
         Args:
             activities: Any iterable of Activity objects (UnscheduledActivity or ScheduledActivity).
-                       Will be validated and stored as a frozenset.
+                       Will be validated and stored as a tuple.
+        """
+        # Materialize once so every check walks the same sequence; tuple() returns
+        # a tuple argument as-is, so callers that already hold one pay no copy
+        activities_tuple = tuple(activities)
+        _validate_not_empty(activities_tuple)
+        index_by_name = _index_unique_names(activities_tuple)
+        dependency_graph = _build_dependency_graph(activities_tuple, index_by_name)
+
+        object.__setattr__(self, "activities", activities_tuple)
+        object.__setattr__(self, "dependency_graph", dependency_graph)
+        object.__setattr__(self, "_index_by_name", index_by_name)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare networks of the same type by their set of activities."""
+        if not isinstance(other, ProjectNetwork) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._activity_set == other._activity_set
+
+    def __hash__(self) -> int:
+        """Return hash based on the set of activities."""
+        return hash(self._activity_set)
+
+    @cached_property
+    def _activity_set(self) -> frozenset[ActivityT]:
+        """The activities as an unordered set, built on first comparison or hash."""
+        return frozenset(self.activities)
+
+    @cached_property
+    def topological_order(self) -> tuple[ActivityT, ...]:
+        """The activities ordered so that each comes after all of its dependencies.
+
+        Derived from the dependency graph on first use and cached.
         """
-        _validate_not_empty(activities)
-        _validate_unique_names(activities)
-        _validate_dependencies_exist(activities)
-        _validate_no_cycles(activities)
+        return tuple(self.activities[index] for index in self.dependency_graph.order)
 
-        # Store validated activities as frozenset
-        object.__setattr__(self, "activities", frozenset(activities))
+    def __contains__(self, name: object) -> bool:
+        """Check whether the network has an activity with the given name."""
+        return name in self._index_by_name
+
+    def get(self, name: ActivityName) -> ActivityT:
+        """Look up an activity by name.
+
+        Raises:
+            KeyError: If the network has no activity with the given name.
+        """
+        return self.activities[self._index_by_name[name]]
 
 
 class UnscheduledProjectNetwork(ProjectNetwork[UnscheduledActivity]):
@@ -115,11 +185,12 @@ class UnscheduledProjectNetwork(ProjectNetwork[UnscheduledActivity]):
 class ScheduledProjectNetwork(ProjectNetwork[ScheduledActivity]):
     """Value object representing a validated network of scheduled activities."""
 
-    @property
+    @cached_property
     def project_duration(self) -> Duration:
         """Calculate the total project duration.
 
         Project duration is the maximum earliest finish time across all activities.
         This represents the minimum time required to complete the entire project.
+        The network is immutable, so the value is computed once and cached.
         """
         return max(activity.earliest_finish for activity in self.activities)
@@ -1,41 +1,50 @@
 """Scheduling domain service for Critical Path Method."""
 
+import weakref
 from dataclasses import dataclass
 from decimal import Decimal
 
 from parade.domain.activity import (
-    ActivityName,
     Duration,
     ScheduledActivity,
     UnscheduledActivity,
 )
 from parade.domain.project_network import (
+    DependencyGraph,
     ScheduledProjectNetwork,
     UnscheduledProjectNetwork,
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForwardPassResult:
     """Result of the forward pass calculation.
 
-    Contains earliest start/finish times and the overall project end time.
+    Contains earliest start/finish times, indexed by activity position in the
+    network, and the overall project end time.
     """
 
-    earliest_starts: dict[ActivityName, Duration]
-    earliest_finishes: dict[ActivityName, Duration]
-    project_end: Duration
+    earliest_starts: list[Decimal]
+    earliest_finishes: list[Decimal]
+    project_end: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackwardPassResult:
     """Result of the backward pass calculation.
 
-    Contains latest start/finish times for all activities.
+    Contains latest start/finish times for all activities, indexed by activity
+    position in the network.
     """
 
-    latest_starts: dict[ActivityName, Duration]
-    latest_finishes: dict[ActivityName, Duration]
+    latest_starts: list[Decimal]
+    latest_finishes: list[Decimal]
+
+
+# Schedules keyed by id() of the network they were calculated for. Equal networks
+# may spell their durations differently ("1.5" vs "1.50"), so only the very same
+# network object may reuse a schedule; entries are dropped when it is collected.
+_schedules: dict[int, ScheduledProjectNetwork] = {}
 
 
 def schedule(network: UnscheduledProjectNetwork) -> ScheduledProjectNetwork:
@@ -43,74 +52,69 @@ def schedule(network: UnscheduledProjectNetwork) -> ScheduledProjectNetwork:
 
     Performs forward pass to calculate earliest start/finish times,
     then backward pass to calculate latest start/finish times.
+
+    Networks are immutable, so the result is cached for as long as the network
+    object lives: scheduling it again returns the same schedule.
     """
-    # Create lookup for activities by ID (shared by both passes)
-    activity_map = {activity.name: activity for activity in network.activities}
+    network_id = id(network)
+    cached = _schedules.get(network_id)
+    if cached is None:
+        cached = _schedules[network_id] = _calculate_schedule(network)
+        weakref.finalize(network, _schedules.pop, network_id, None)
+    return cached
+
+
+def _calculate_schedule(network: UnscheduledProjectNetwork) -> ScheduledProjectNetwork:
+    """Run both CPM passes and build the scheduled network."""
+    # Both passes run over the dependency graph built when the network was validated
+    graph = network.dependency_graph
+    durations = [activity.duration.value for activity in network.activities]
 
     # Forward pass: calculate earliest start and finish times
-    forward_result = _forward_pass(network, activity_map)
+    forward_result = _forward_pass(graph, durations)
 
     # Backward pass: calculate latest start and finish times
-    backward_result = _backward_pass(network, activity_map, forward_result)
+    backward_result = _backward_pass(graph, durations, forward_result)
 
     # Create scheduled activities
-    scheduled_activities = frozenset(
-        ScheduledActivity(
-            name=activity.name,
-            duration=activity.duration,
-            depends_on=activity.dependencies,
-            earliest_start=forward_result.earliest_starts[activity.name],
-            earliest_finish=forward_result.earliest_finishes[activity.name],
-            latest_start=backward_result.latest_starts[activity.name],
-            latest_finish=backward_result.latest_finishes[activity.name],
-        )
-        for activity in network.activities
+    scheduled_activities = tuple(
+        _to_scheduled(activity, index, forward_result, backward_result)
+        for index, activity in enumerate(network.activities)
     )
 
     return ScheduledProjectNetwork(activities=scheduled_activities)
 
 
-def _forward_pass(
-    network: UnscheduledProjectNetwork,
-    activity_map: dict[ActivityName, UnscheduledActivity],
-) -> ForwardPassResult:
+def _forward_pass(graph: DependencyGraph, durations: list[Decimal]) -> ForwardPassResult:
     """Calculate earliest start and finish times for all activities.
 
+    Args:
+        graph: The network's dependency graph.
+        durations: Activity durations, indexed by activity position.
+
     Returns:
         ForwardPassResult containing earliest times and project end.
     """
-    earliest_starts: dict[ActivityName, Duration] = {}
-    earliest_finishes: dict[ActivityName, Duration] = {}
-
-    # Process activities in topological order
-    def calculate_earliest(activity_name: ActivityName) -> None:
-        """Recursively calculate earliest times."""
-        if activity_name in earliest_starts:
-            return
-
-        activity = activity_map[activity_name]
-
-        # Calculate earliest start based on dependencies
-        if not activity.dependencies:
+    project_start = Decimal(0)
+    earliest_starts = [project_start] * len(durations)
+    earliest_finishes = [project_start] * len(durations)
+
+    # Topological order guarantees every dependency is finished before it is needed
+    for index in graph.order:
+        dependency_indices = graph.predecessors[index]
+        if not dependency_indices:
             # No dependencies - can start at time 0
-            earliest_starts[activity_name] = Duration(Decimal(0))
+            earliest_start = project_start
         else:
             # Must wait for all dependencies to finish
-            for dependency_name in activity.dependencies:
-                calculate_earliest(dependency_name)
-
-            max_finish = max(earliest_finishes[dependency_name] for dependency_name in activity.dependencies)
-            earliest_starts[activity_name] = max_finish
+            earliest_start = max([earliest_finishes[dependency] for dependency in dependency_indices])
 
         # Earliest finish = earliest start + duration
-        earliest_finishes[activity_name] = earliest_starts[activity_name] + activity.duration
-
-    # Calculate for all activities
-    for activity in network.activities:
-        calculate_earliest(activity.name)
+        earliest_starts[index] = earliest_start
+        earliest_finishes[index] = earliest_start + durations[index]
 
     # Find project completion time
-    project_end = max(earliest_finishes.values())
+    project_end = max(earliest_finishes)
 
     return ForwardPassResult(
         earliest_starts=earliest_starts,
@@ -120,57 +124,54 @@ def _forward_pass(
 
 
 def _backward_pass(
-    network: UnscheduledProjectNetwork,
-    activity_map: dict[ActivityName, UnscheduledActivity],
+    graph: DependencyGraph,
+    durations: list[Decimal],
     forward_result: ForwardPassResult,
 ) -> BackwardPassResult:
     """Calculate latest start and finish times for all activities.
 
     Args:
-        network: The project network.
-        activity_map: Lookup dictionary for activities by name.
+        graph: The network's dependency graph.
+        durations: Activity durations, indexed by activity position.
         forward_result: Results from the forward pass.
 
     Returns:
         BackwardPassResult containing latest start/finish times.
     """
-    latest_starts: dict[ActivityName, Duration] = {}
-    latest_finishes: dict[ActivityName, Duration] = {}
-
-    # Build reverse dependency map (successors)
-    successors: dict[ActivityName, set[ActivityName]] = {activity.name: set() for activity in network.activities}
-    for activity in network.activities:
-        for dependency_name in activity.dependencies:
-            successors[dependency_name].add(activity.name)
-
-    # Process activities in reverse topological order
-    def calculate_latest(activity_name: ActivityName) -> None:
-        """Recursively calculate latest times."""
-        if activity_name in latest_finishes:
-            return
+    latest_starts = [forward_result.project_end] * len(durations)
+    latest_finishes = [forward_result.project_end] * len(durations)
 
-        activity = activity_map[activity_name]
-
-        # Calculate latest finish based on successors
-        if not successors[activity_name]:
+    # Reverse topological order guarantees every successor is settled before it is needed
+    for index in reversed(graph.order):
+        successor_indices = graph.successors[index]
+        if not successor_indices:
             # No successors - must finish by project end
-            latest_finishes[activity_name] = forward_result.project_end
+            latest_finish = forward_result.project_end
         else:
             # Must finish before any successor starts
-            for successor_name in successors[activity_name]:
-                calculate_latest(successor_name)
-
-            min_start = min(latest_starts[successor_name] for successor_name in successors[activity_name])
-            latest_finishes[activity_name] = min_start
+            latest_finish = min([latest_starts[successor] for successor in successor_indices])
 
         # Latest start = latest finish - duration
-        latest_starts[activity_name] = latest_finishes[activity_name] - activity.duration
-
-    # Calculate for all activities
-    for activity in network.activities:
-        calculate_latest(activity.name)
+        latest_finishes[index] = latest_finish
+        latest_starts[index] = latest_finish - durations[index]
 
     return BackwardPassResult(
         latest_starts=latest_starts,
         latest_finishes=latest_finishes,
     )
+
+
+def _to_scheduled(
+    activity: UnscheduledActivity,
+    index: int,
+    forward_result: ForwardPassResult,
+    backward_result: BackwardPassResult,
+) -> ScheduledActivity:
+    """Combine an activity with the times computed for its position."""
+    return ScheduledActivity.from_activity(
+        activity,
+        earliest_start=Duration(forward_result.earliest_starts[index]),
+        earliest_finish=Duration(forward_result.earliest_finishes[index]),
+        latest_start=Duration(backward_result.latest_starts[index]),
+        latest_finish=Duration(backward_result.latest_finishes[index]),
+    )
@@ -1,6 +1,11 @@
 """Tests for export application services."""
 
+import copy
+import io
+import os
+from collections.abc import Buffer
 from pathlib import Path
+from typing import TextIO
 
 import pytest
 
@@ -43,6 +48,18 @@ class TestFileExporter:
         # Verify the return value is the absolute path
         assert result_path == temp_file_path.absolute()
 
+    def test_export_bytes_content(
+        self,
+        sample_content: str,
+        temp_file_path: Path,
+        file_exporter: Exporter,
+    ) -> None:
+        """Test that already-encoded content is written unchanged."""
+        result_path = export_to(file_exporter, temp_file_path, sample_content.encode("utf-8"))
+
+        assert temp_file_path.read_text(encoding="utf-8") == sample_content
+        assert result_path == temp_file_path.absolute()
+
     def test_export_creates_parent_directories(
         self,
         sample_content: str,
@@ -63,6 +80,212 @@ class TestFileExporter:
         assert nested_path.read_text(encoding="utf-8") == sample_content
         assert result_path == nested_path.absolute()
 
+    def test_export_overwrites_existing_file(
+        self,
+        sample_content: str,
+        temp_file_path: Path,
+        file_exporter: Exporter,
+    ) -> None:
+        """Test that exporting over an existing file replaces its content atomically."""
+        temp_file_path.write_text("previous content that is longer than the new one", encoding="utf-8")
+
+        export_to(file_exporter, temp_file_path, sample_content)
+
+        assert temp_file_path.read_text(encoding="utf-8") == sample_content
+        assert not temp_file_path.with_suffix(".json.tmp").exists()
+
+    @pytest.mark.parametrize("existing", [False, True], ids=["new_file", "overwrite"])
+    def test_export_with_fsync(
+        self,
+        sample_content: str,
+        temp_file_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        *,
+        existing: bool,
+    ) -> None:
+        """Test that fsync=True flushes the file and, on POSIX, its parent directory."""
+        if existing:
+            temp_file_path.write_text("old", encoding="utf-8")
+        fsync_calls: list[int] = []
+        real_fsync = os.fsync
+
+        def recording_fsync(fd: int) -> None:
+            fsync_calls.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", recording_fsync)
+        exporter = FileExporter(allowed_base_dir=tmp_path, fsync=True)
+
+        exporter.export(sample_content, temp_file_path)
+
+        assert temp_file_path.read_text(encoding="utf-8") == sample_content
+        # The parent directory can only be fsynced on POSIX systems
+        assert len(fsync_calls) == (2 if os.name == "posix" else 1)
+
+    def test_relative_base_dir_resolves_against_current_directory(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a relative base dir resolves against the current working directory."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        first_exporter = FileExporter(allowed_base_dir=Path("exports"))
+        monkeypatch.chdir(second)
+        second_exporter = FileExporter(allowed_base_dir=Path("exports"))
+
+        assert first_exporter.allowed_base_dir == first.resolve() / "exports"
+        assert second_exporter.allowed_base_dir == second.resolve() / "exports"
+
+    def test_base_dir_symlink_is_resolved_per_exporter(self, tmp_path: Path) -> None:
+        """Test that re-pointing a symlinked base dir takes effect for new exporters."""
+        first_release = tmp_path / "r1"
+        second_release = tmp_path / "r2"
+        first_release.mkdir()
+        second_release.mkdir()
+        current = tmp_path / "current"
+        current.symlink_to(first_release)
+        FileExporter(allowed_base_dir=current)
+
+        current.unlink()
+        current.symlink_to(second_release)
+        exporter = FileExporter(allowed_base_dir=current)
+
+        assert exporter.allowed_base_dir == second_release.resolve()
+        result_path = exporter.export("content", current / "out.json")
+        assert result_path == second_release.resolve() / "out.json"
+        with pytest.raises(PathTraversalError):
+            exporter.export("content", first_release / "out.json")
+
+
+class _HalfWriteFile(io.FileIO):
+    """Unbuffered file that accepts only half of each write, like a short raw write."""
+
+    def write(self, data: Buffer, /) -> int:
+        """Write the first half of data (at least one byte) and report how much was written."""
+        chunk = memoryview(data)
+        return super().write(chunk[: max(1, chunk.nbytes // 2)])
+
+
+class TestFileExporterStreaming:
+    """Tests for streaming exports through FileExporter.export_stream."""
+
+    def test_export_stream_counts_short_writes_once(
+        self,
+        temp_file_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that bytes resent after a short write are not counted twice against the limit."""
+        original_open = Path.open
+
+        def open_with_short_writes(path: Path, mode: str = "r", buffering: int = -1, **kwargs: str | None) -> object:
+            if mode == "wb" and buffering == 0:
+                return _HalfWriteFile(path, "wb")
+            return original_open(path, mode, buffering, **kwargs)
+
+        monkeypatch.setattr(Path, "open", open_with_short_writes)
+        exporter = FileExporter(allowed_base_dir=tmp_path, max_file_size_bytes=100)
+
+        exporter.export_stream(lambda stream: stream.write("x" * 80), temp_file_path)
+
+        assert temp_file_path.read_bytes() == b"x" * 80
+        with pytest.raises(FileSizeLimitExceededError) as exc_info:
+            exporter.export_stream(lambda stream: stream.write("y" * 101), temp_file_path)
+        assert exc_info.value.content_size == 101
+
+    def test_export_stream_writes_content(
+        self,
+        sample_content: str,
+        temp_file_path: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test that content written by the writer callable ends up in the file."""
+        exporter = FileExporter(allowed_base_dir=tmp_path)
+
+        result_path = exporter.export_stream(lambda stream: stream.write(sample_content), temp_file_path)
+
+        assert temp_file_path.read_text(encoding="utf-8") == sample_content
+        assert result_path == temp_file_path.absolute()
+
+    def test_export_stream_enforces_size_limit(
+        self,
+        temp_file_path: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test that the size limit is enforced while streaming and nothing is left behind."""
+        max_size = 1024
+        exporter = FileExporter(allowed_base_dir=tmp_path, max_file_size_bytes=max_size)
+
+        def write_too_much(stream: TextIO) -> None:
+            stream.writelines("x" * 512 for _ in range(100))
+
+        with pytest.raises(FileSizeLimitExceededError) as exc_info:
+            exporter.export_stream(write_too_much, temp_file_path)
+
+        assert exc_info.value.content_size > max_size
+        assert exc_info.value.max_size == max_size
+        assert list(tmp_path.iterdir()) == []
+
+    def test_export_stream_cleans_up_when_writer_fails(
+        self,
+        temp_file_path: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test that an exception from the writer removes the temporary file."""
+        exporter = FileExporter(allowed_base_dir=tmp_path)
+
+        def failing_writer(stream: TextIO) -> None:
+            stream.write("partial")
+            msg = "formatter failed"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="formatter failed"):
+            exporter.export_stream(failing_writer, temp_file_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_export_stream_writer_error_is_not_masked_by_size_limit(
+        self,
+        temp_file_path: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a writer failing with more than the limit buffered keeps its own exception."""
+        exporter = FileExporter(allowed_base_dir=tmp_path, max_file_size_bytes=10)
+
+        def failing_writer(stream: TextIO) -> None:
+            stream.write("x" * 50)
+            msg = "formatter failed"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="formatter failed"):
+            exporter.export_stream(failing_writer, temp_file_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_default_export_stream_buffers_into_export(self, sample_content: str, temp_file_path: Path) -> None:
+        """Test that exporters without streaming support receive the buffered content."""
+
+        class RecordingExporter(Exporter):
+            def __init__(self) -> None:
+                self.exported: list[str | bytes] = []
+
+            def export(self, content: str | bytes, path: Path) -> Path:
+                self.exported.append(content)
+                return path
+
+        exporter = RecordingExporter()
+
+        result = exporter.export_stream(lambda stream: stream.write(sample_content), temp_file_path)
+
+        assert exporter.exported == [sample_content]
+        assert result == temp_file_path
+
 
 class TestFileExporterSecurity:
     """Tests for FileExporter security features."""
@@ -95,6 +318,36 @@ class TestFileExporterSecurity:
 
         assert exc_info.value.allowed_base == tmp_path / "safe"
 
+    def test_prevents_sibling_directory_sharing_name_prefix(
+        self,
+        sample_content: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a sibling directory whose name starts with the base name is rejected."""
+        exporter = FileExporter(allowed_base_dir=tmp_path / "safe")
+        sibling_path = tmp_path / "safe_not" / "output.json"
+
+        with pytest.raises(PathTraversalError):
+            exporter.export(sample_content, sibling_path)
+
+    def test_prevents_escape_through_symlinked_directory(
+        self,
+        sample_content: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a path without '..' cannot escape through a symlink inside the base directory."""
+        safe_dir = tmp_path / "safe"
+        outside_dir = tmp_path / "outside"
+        safe_dir.mkdir()
+        outside_dir.mkdir()
+        (safe_dir / "link").symlink_to(outside_dir, target_is_directory=True)
+        exporter = FileExporter(allowed_base_dir=safe_dir)
+
+        with pytest.raises(PathTraversalError):
+            exporter.export(sample_content, safe_dir / "link" / "output.json")
+
+        assert not (outside_dir / "output.json").exists()
+
     def test_allows_paths_within_allowed_directory(
         self,
         sample_content: str,
@@ -144,6 +397,38 @@ class TestFileExporterSecurity:
         assert exc_info.value.content_size == 2048
         assert exc_info.value.max_size == max_size
 
+    def test_size_limit_counts_encoded_bytes(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that multi-byte text within the character count but over the byte limit is rejected."""
+        max_size = 1024
+        exporter = FileExporter(allowed_base_dir=tmp_path, max_file_size_bytes=max_size)
+        # 600 characters, 1,800 bytes once UTF-8 encoded
+        multibyte_content = "✓" * 600
+
+        with pytest.raises(FileSizeLimitExceededError) as exc_info:
+            exporter.export(multibyte_content, tmp_path / "large.txt")
+
+        assert exc_info.value.content_size == 1800
+        assert not (tmp_path / "large.txt").exists()
+
+    def test_size_limit_reports_encoded_bytes_of_long_text(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Test that multi-byte text over the limit even in characters reports its byte size."""
+        max_size = 1024
+        exporter = FileExporter(allowed_base_dir=tmp_path, max_file_size_bytes=max_size)
+        # 2,000 characters, 6,000 bytes once UTF-8 encoded
+        multibyte_content = "✓" * 2000
+
+        with pytest.raises(FileSizeLimitExceededError, match="6,000 bytes") as exc_info:
+            exporter.export(multibyte_content, tmp_path / "large.txt")
+
+        assert exc_info.value.content_size == 6000
+        assert not (tmp_path / "large.txt").exists()
+
     def test_allows_files_within_size_limit(
         self,
         tmp_path: Path,
@@ -159,3 +444,33 @@ class TestFileExporterSecurity:
         assert output_path.exists()
         assert output_path.read_text(encoding="utf-8") == small_content
         assert result == output_path.absolute()
+
+
+class TestExporterErrors:
+    """Tests for exporter error types."""
+
+    def test_path_traversal_error_message_and_reconstruction(self) -> None:
+        """Test that PathTraversalError renders its message and can be rebuilt from its args."""
+        error = PathTraversalError(Path("/etc/passwd"), Path("/srv/exports"))
+
+        restored = copy.copy(error)
+
+        assert str(error) == (
+            "Path '/etc/passwd' is outside allowed base directory '/srv/exports'. "
+            "Path traversal attempts are not permitted."
+        )
+        assert str(restored) == str(error)
+        assert restored.attempted_path == error.attempted_path
+
+    def test_file_size_limit_error_message_and_reconstruction(self) -> None:
+        """Test that FileSizeLimitExceededError renders its message and can be rebuilt from its args."""
+        error = FileSizeLimitExceededError(2048, 1024)
+
+        restored = copy.copy(error)
+
+        assert str(error) == (
+            "Content size (2,048 bytes) exceeds maximum allowed file size (1,024 bytes). "
+            "This limit prevents disk exhaustion attacks."
+        )
+        assert str(restored) == str(error)
+        assert restored.content_size == error.content_size
@@ -1,5 +1,6 @@
 """Tests for formatting application services."""
 
+import io
 import json
 from decimal import Decimal
 
@@ -55,8 +56,10 @@ class TestFormatAsJson:
         assert data["project_duration"] == "8"
         assert len(data["activities"]) == 2
 
+        activities_by_name = {a["name"]: a for a in data["activities"]}
+
         # Verify activity A
-        activity_a = next(a for a in data["activities"] if a["name"] == "A")
+        activity_a = activities_by_name["A"]
         assert activity_a["duration"] == "5"
         assert activity_a["dependencies"] == []
         assert activity_a["earliest_start"] == "0"
@@ -64,9 +67,61 @@ class TestFormatAsJson:
         assert activity_a["is_critical"] is True
 
         # Verify activity B
-        activity_b = next(a for a in data["activities"] if a["name"] == "B")
+        activity_b = activities_by_name["B"]
         assert activity_b["duration"] == "3"
         assert activity_b["dependencies"] == ["A"]
         assert activity_b["earliest_start"] == "5"
         assert activity_b["earliest_finish"] == "8"
         assert activity_b["is_critical"] is True
+
+    def test_format_bytes_matches_format(
+        self,
+        simple_scheduled_network: ScheduledProjectNetwork,
+        json_formatter: ProjectFormatter,
+    ) -> None:
+        """Test that format_bytes is the UTF-8 encoding of format."""
+        result = json_formatter.format_bytes(simple_scheduled_network)
+
+        assert result == format_as(json_formatter, simple_scheduled_network).encode("utf-8")
+
+    def test_write_to_matches_format(
+        self,
+        simple_scheduled_network: ScheduledProjectNetwork,
+        json_formatter: ProjectFormatter,
+    ) -> None:
+        """Test that streaming the JSON produces the same output as format."""
+        stream = io.StringIO()
+
+        json_formatter.write_to(simple_scheduled_network, stream)
+
+        assert stream.getvalue() == format_as(json_formatter, simple_scheduled_network)
+
+    def test_format_matches_stdlib_json_layout(self, json_formatter: ProjectFormatter) -> None:
+        """Test that the output is laid out exactly like json.dumps(indent=2) and escapes names."""
+        design = ActivityName('Design "v2" ✓')
+        network = ScheduledProjectNetwork(
+            [
+                ScheduledActivity(
+                    name=design,
+                    duration=Duration(Decimal("1.5")),
+                    earliest_start=Duration(Decimal(0)),
+                    earliest_finish=Duration(Decimal("1.5")),
+                    latest_start=Duration(Decimal(0)),
+                    latest_finish=Duration(Decimal("1.5")),
+                ),
+                ScheduledActivity(
+                    name=ActivityName("Build"),
+                    duration=Duration(Decimal(2)),
+                    depends_on=frozenset([design]),
+                    earliest_start=Duration(Decimal("1.5")),
+                    earliest_finish=Duration(Decimal("3.5")),
+                    latest_start=Duration(Decimal("1.5")),
+                    latest_finish=Duration(Decimal("3.5")),
+                ),
+            ],
+        )
+
+        result = format_as(json_formatter, network)
+
+        assert result == json.dumps(json.loads(result), indent=2)
+        assert {activity["name"] for activity in json.loads(result)["activities"]} == {design.value, "Build"}
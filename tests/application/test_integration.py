@@ -12,9 +12,12 @@ from parade.domain.activity import ActivityName, Duration, ScheduledActivity
 from parade.domain.project_network import ScheduledProjectNetwork
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_scheduled_network() -> ScheduledProjectNetwork:
-    """Create a more complex scheduled network for integration testing."""
+    """Create a more complex scheduled network for integration testing.
+
+    The network is immutable, so it is built once and shared by every test.
+    """
     activities = [
         ScheduledActivity(
             name=ActivityName("Start"),
@@ -89,17 +92,20 @@ class TestFormatAndExportIntegration:
         assert data["project_duration"] == "9"
         assert len(data["activities"]) == 4
 
+        activities_by_name = {a["name"]: a for a in data["activities"]}
+
         # Verify critical path activities (A and C)
-        activity_a = next(a for a in data["activities"] if a["name"] == "A")
+        activity_a = activities_by_name["A"]
         assert activity_a["is_critical"] is True
         assert activity_a["total_float"] == "0"
 
-        activity_c = next(a for a in data["activities"] if a["name"] == "C")
+        activity_c = activities_by_name["C"]
         assert activity_c["is_critical"] is True
         assert activity_c["total_float"] == "0"
+        assert activity_c["dependencies"] == ["A", "B"]
 
         # Verify non-critical activity (B has float)
-        activity_b = next(a for a in data["activities"] if a["name"] == "B")
+        activity_b = activities_by_name["B"]
         assert activity_b["is_critical"] is False
         assert activity_b["total_float"] == "2"
 
@@ -127,3 +133,21 @@ class TestFormatAndExportIntegration:
         data = json.loads(output_file.read_text(encoding="utf-8"))
         assert data["project_duration"] == "9"
         assert len(data["activities"]) == 4
+
+    def test_stream_json_to_file(
+        self,
+        complex_scheduled_network: ScheduledProjectNetwork,
+        tmp_path: Path,
+        json_formatter: ProjectFormatter,
+        file_exporter: Exporter,
+    ) -> None:
+        """Test streaming formatter output straight into the exported file."""
+        output_file = tmp_path / "project.json"
+
+        result = file_exporter.export_stream(
+            lambda stream: json_formatter.write_to(complex_scheduled_network, stream),
+            output_file,
+        )
+
+        assert result == output_file.absolute()
+        assert output_file.read_text(encoding="utf-8") == format_as(json_formatter, complex_scheduled_network)
@@ -1,5 +1,7 @@
 """Tests for project network validation and queries."""
 
+import gc
+import weakref
 from decimal import Decimal
 
 import pytest
@@ -127,6 +129,134 @@ class TestUnscheduledProjectNetwork:
         with pytest.raises(ValueError, match="circular dependencies"):
             UnscheduledProjectNetwork(activities=activities)
 
+    def test_cycle_downstream_of_valid_chain_raises_error(self) -> None:
+        """Test that a cycle is detected even when other activities are acyclic."""
+        activities = [
+            UnscheduledActivity(name=ActivityName("Start"), duration=Duration(Decimal("1.0"))),
+            UnscheduledActivity(
+                name=ActivityName("A"),
+                duration=Duration(Decimal("1.0")),
+                depends_on=frozenset(["Start", "B"]),
+            ),
+            UnscheduledActivity(
+                name=ActivityName("B"),
+                duration=Duration(Decimal("1.0")),
+                depends_on=frozenset(["A"]),
+            ),
+        ]
+        with pytest.raises(ValueError, match="circular dependencies"):
+            UnscheduledProjectNetwork(activities=activities)
+
+    def test_network_accepts_single_pass_iterable(self) -> None:
+        """Test that a generator of activities is validated and stored in full."""
+        names = ["A", "B", "C"]
+        activities = (
+            UnscheduledActivity(
+                name=ActivityName(name),
+                duration=Duration(Decimal("1.0")),
+                depends_on=frozenset(names[:i]),
+            )
+            for i, name in enumerate(names)
+        )
+
+        network = UnscheduledProjectNetwork(activities=activities)
+
+        assert {activity.name.value for activity in network.activities} == set(names)
+
+    def test_activities_keep_input_order(self) -> None:
+        """Test that activities are stored in the order they were given."""
+        activities = [
+            UnscheduledActivity(name=ActivityName(name), duration=Duration(Decimal("1.0"))) for name in ["C", "A", "B"]
+        ]
+
+        network = UnscheduledProjectNetwork(activities=activities)
+
+        assert network.activities == tuple(activities)
+
+    def test_equality_ignores_input_order(self) -> None:
+        """Test that networks with the same activities are equal and hash alike in any order."""
+        first = UnscheduledActivity(name=ActivityName("A"), duration=Duration(Decimal("1.0")))
+        second = UnscheduledActivity(name=ActivityName("B"), duration=Duration(Decimal("2.0")))
+
+        network = UnscheduledProjectNetwork(activities=[first, second])
+        reordered = UnscheduledProjectNetwork(activities=[second, first])
+
+        assert network == reordered
+        assert hash(network) == hash(reordered)
+        assert network != UnscheduledProjectNetwork(activities=[first])
+        assert network != schedule(network)
+
+    def test_topological_order_places_dependencies_first(self) -> None:
+        """Test that topological_order lists every activity after its dependencies."""
+        activities = [
+            UnscheduledActivity(
+                name=ActivityName("C"),
+                duration=Duration(Decimal("1.0")),
+                depends_on=frozenset(["A", "B"]),
+            ),
+            UnscheduledActivity(
+                name=ActivityName("B"),
+                duration=Duration(Decimal("1.0")),
+                depends_on=frozenset(["A"]),
+            ),
+            UnscheduledActivity(name=ActivityName("A"), duration=Duration(Decimal("1.0"))),
+        ]
+
+        network = UnscheduledProjectNetwork(activities=activities)
+
+        assert [activity.name.value for activity in network.topological_order] == ["A", "B", "C"]
+
+    def test_dependency_graph_uses_activity_positions(self) -> None:
+        """Test that the dependency graph refers to activities by their position in the network."""
+        activities = [
+            UnscheduledActivity(
+                name=ActivityName("B"),
+                duration=Duration(Decimal("1.0")),
+                depends_on=frozenset(["A"]),
+            ),
+            UnscheduledActivity(name=ActivityName("A"), duration=Duration(Decimal("1.0"))),
+        ]
+
+        graph = UnscheduledProjectNetwork(activities=activities).dependency_graph
+
+        assert graph.order == (1, 0)
+        assert graph.predecessors == ((1,), ())
+        assert graph.successors == ((), (0,))
+
+    def test_get_activity_by_name(self) -> None:
+        """Test looking up activities by name."""
+        first = UnscheduledActivity(name=ActivityName("A"), duration=Duration(Decimal("1.0")))
+        second = UnscheduledActivity(
+            name=ActivityName("B"),
+            duration=Duration(Decimal("2.0")),
+            depends_on=frozenset(["A"]),
+        )
+
+        network = UnscheduledProjectNetwork(activities=[first, second])
+
+        assert network.get(ActivityName("B")) is second
+        assert ActivityName("A") in network
+        assert ActivityName("Z") not in network
+        with pytest.raises(KeyError):
+            network.get(ActivityName("Z"))
+
+    def test_long_dependency_chain_is_valid(self) -> None:
+        """Test that validating a chain deeper than the recursion limit succeeds."""
+        chain_length = 5000
+        activities = [UnscheduledActivity(name=ActivityName("0"), duration=Duration(Decimal("1.0")))]
+        activities.extend(
+            UnscheduledActivity(
+                name=ActivityName(str(i)),
+                duration=Duration(Decimal("1.0")),
+                depends_on=frozenset([str(i - 1)]),
+            )
+            for i in range(1, chain_length)
+        )
+
+        network = UnscheduledProjectNetwork(activities=activities)
+
+        assert len(network.activities) == chain_length
+
 
 class TestScheduledProjectNetwork:
     """Tests for ScheduledProjectNetwork queries."""
@@ -153,6 +283,47 @@ class TestScheduledProjectNetwork:
         # Project duration should be 8 (A=5 + B=3)
         assert result.project_duration == Duration(Decimal("8.0"))
 
+    def test_schedule_is_cached_per_network(self) -> None:
+        """Test that scheduling the same network again returns the cached schedule."""
+        network = UnscheduledProjectNetwork(
+            activities=[UnscheduledActivity(name=ActivityName("A"), duration=Duration(Decimal("5.0")))],
+        )
+        equal_network = UnscheduledProjectNetwork(activities=network.activities)
+
+        first = schedule(network)
+
+        assert schedule(network) is first
+        assert schedule(equal_network) is not first
+        assert schedule(equal_network) == first
+
+    def test_project_duration_is_cached(self) -> None:
+        """Test that project_duration is computed once and does not affect equality."""
+        network = UnscheduledProjectNetwork(
+            activities=[UnscheduledActivity(name=ActivityName("A"), duration=Duration(Decimal("5.0")))],
+        )
+        first = schedule(network)
+        # A separate but equal network, so it is not served the cached schedule
+        second = schedule(UnscheduledProjectNetwork(network.activities))
+
+        duration = first.project_duration
+
+        assert first.project_duration is duration
+        assert second is not first
+        assert first == second
+
+    def test_schedule_cache_entry_is_dropped_with_network(self) -> None:
+        """Test that a network's cached schedule is released when the network is collected."""
+        network = UnscheduledProjectNetwork(
+            activities=[UnscheduledActivity(name=ActivityName("A"), duration=Duration(Decimal("5.0")))],
+        )
+        scheduled = weakref.ref(schedule(network))
+        assert scheduled() is not None
+
+        del network
+        gc.collect()
+
+        assert scheduled() is None
+
 
 class TestActivityDependencyChecking:
     """Tests for has_dependency method."""
@@ -177,6 +348,15 @@ class TestActivityDependencyChecking:
         )
         assert not activity.has_dependency(ActivityName("B"))
 
+    def test_dependencies_are_ordered_by_name(self) -> None:
+        """Test that dependencies are stored once each, ordered by value."""
+        activity = UnscheduledActivity(
+            name=ActivityName("A"),
+            duration=Duration(Decimal("1.0")),
+            depends_on=frozenset(["D", ActivityName("B"), "C", ActivityName("D")]),
+        )
+        assert activity.dependencies == (ActivityName("B"), ActivityName("C"), ActivityName("D"))
+
     def test_scheduled_activity_has_dependency(self) -> None:
         """Test has_dependency on ScheduledActivity."""
         activity = ScheduledActivity(
@@ -191,3 +371,55 @@ class TestActivityDependencyChecking:
         assert activity.has_dependency(ActivityName("B"))
         assert activity.has_dependency(ActivityName("C"))
         assert not activity.has_dependency(ActivityName("D"))
+
+    def test_scheduled_activity_from_activity_matches_constructor(self) -> None:
+        """Test that from_activity builds the same activity as the constructor."""
+        unscheduled = UnscheduledActivity(
+            name=ActivityName("A"),
+            duration=Duration(Decimal("1.0")),
+            depends_on=frozenset(["C", "B"]),
+        )
+        times = {
+            "earliest_start": Duration(Decimal(0)),
+            "earliest_finish": Duration(Decimal("1.0")),
+            "latest_start": Duration(Decimal("2.0")),
+            "latest_finish": Duration(Decimal("3.0")),
+        }
+
+        built = ScheduledActivity.from_activity(unscheduled, **times)
+        constructed = ScheduledActivity(
+            name=unscheduled.name,
+            duration=unscheduled.duration,
+            depends_on=frozenset(unscheduled.dependencies),
+            **times,
+        )
+
+        assert built == constructed
+        assert built.total_float == constructed.total_float
+        assert built.is_critical == constructed.is_critical
+
+    def test_scheduled_activity_stores_float_and_criticality(self) -> None:
+        """Test that total_float and is_critical are derived from the times at creation."""
+        activity = ScheduledActivity(
+            name=ActivityName("A"),
+            duration=Duration(Decimal("1.0")),
+            earliest_start=Duration(Decimal("1.5")),
+            earliest_finish=Duration(Decimal("2.5")),
+            latest_start=Duration(Decimal("1.5")),
+            latest_finish=Duration(Decimal("2.5")),
+        )
+        assert activity.total_float.value == 0
+        assert activity.is_critical
+        assert "total_float" not in repr(activity)
+
+    def test_scheduled_activity_rejects_negative_float(self) -> None:
+        """Test that a latest start before the earliest start is rejected at creation."""
+        with pytest.raises(ValueError, match="Duration cannot be negative"):
+            ScheduledActivity(
+                name=ActivityName("A"),
+                duration=Duration(Decimal("1.0")),
+                earliest_start=Duration(Decimal(2)),
+                earliest_finish=Duration(Decimal(3)),
+                latest_start=Duration(Decimal(1)),
+                latest_finish=Duration(Decimal(2)),
+            )
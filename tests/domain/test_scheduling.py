@@ -4,7 +4,7 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from parade.domain.activity import ActivityName, UnscheduledActivity
-from parade.domain.project_network import UnscheduledProjectNetwork
+from parade.domain.project_network import ScheduledProjectNetwork, UnscheduledProjectNetwork
 from parade.domain.scheduling import schedule
 from tests.strategies import durations
 
@@ -43,32 +43,44 @@ def acyclic_project_networks(draw: st.DrawFn) -> UnscheduledProjectNetwork:
             ),
         )
 
-    return UnscheduledProjectNetwork(activities=frozenset(activities))
+    # Hand the activities over in an arbitrary order Hypothesis can explore and shrink
+    return UnscheduledProjectNetwork(activities=draw(st.permutations(activities)))
 
 
 class TestSchedulingProperties:
     """Property-based tests for the CPM scheduling algorithm."""
 
     @given(acyclic_project_networks())
-    def test_dependency_ordering(self, network: UnscheduledProjectNetwork) -> None:
-        """For any activity A depending on B, earliest_start(A) >= earliest_finish(B)."""
+    def test_schedule_invariants(self, network: UnscheduledProjectNetwork) -> None:
+        """Every CPM invariant holds for a single schedule of the network.
+
+        Scheduling is deterministic, so each example is scheduled once and all the
+        invariants are checked against that result.
+        """
         result = schedule(network)
 
-        scheduled_by_name = {activity.name: activity for activity in result.activities}
+        self._check_dependency_ordering(result)
+        self._check_duration_consistency_earliest(result)
+        self._check_duration_consistency_latest(result)
+        self._check_float_calculation(result)
+        self._check_non_negative_float(result)
+        self._check_timing_order(result)
+        self._check_critical_path_exists(result)
 
+    @staticmethod
+    def _check_dependency_ordering(result: ScheduledProjectNetwork) -> None:
+        """For any activity A depending on B, earliest_start(A) >= earliest_finish(B)."""
         for activity in result.activities:
             for dep_id in activity.dependencies:
-                dep = scheduled_by_name[dep_id]
+                dep = result.get(dep_id)
                 assert activity.earliest_start >= dep.earliest_finish, (
                     f"Activity {activity.name.value} starts at {activity.earliest_start} "
                     f"but depends on {dep_id.value} which finishes at {dep.earliest_finish}"
                 )
 
-    @given(acyclic_project_networks())
-    def test_duration_consistency_earliest(self, network: UnscheduledProjectNetwork) -> None:
+    @staticmethod
+    def _check_duration_consistency_earliest(result: ScheduledProjectNetwork) -> None:
         """For all activities: earliest_finish = earliest_start + duration."""
-        result = schedule(network)
-
         for activity in result.activities:
             expected_finish = activity.earliest_start + activity.duration
             assert activity.earliest_finish == expected_finish, (
@@ -76,11 +88,9 @@ class TestSchedulingProperties:
                 f"!= earliest_start {activity.earliest_start} + duration {activity.duration}"
             )
 
-    @given(acyclic_project_networks())
-    def test_duration_consistency_latest(self, network: UnscheduledProjectNetwork) -> None:
+    @staticmethod
+    def _check_duration_consistency_latest(result: ScheduledProjectNetwork) -> None:
         """For all activities: latest_finish = latest_start + duration."""
-        result = schedule(network)
-
         for activity in result.activities:
             expected_finish = activity.latest_start + activity.duration
             assert activity.latest_finish == expected_finish, (
@@ -88,11 +98,9 @@ class TestSchedulingProperties:
                 f"!= latest_start {activity.latest_start} + duration {activity.duration}"
             )
 
-    @given(acyclic_project_networks())
-    def test_float_calculation(self, network: UnscheduledProjectNetwork) -> None:
+    @staticmethod
+    def _check_float_calculation(result: ScheduledProjectNetwork) -> None:
         """Total float should equal latest_start - earliest_start."""
-        result = schedule(network)
-
         for activity in result.activities:
             expected_float = activity.latest_start - activity.earliest_start
             assert activity.total_float.value == expected_float.value, (
@@ -100,21 +108,17 @@ class TestSchedulingProperties:
                 f"!= latest_start {activity.latest_start} - earliest_start {activity.earliest_start}"
             )
 
-    @given(acyclic_project_networks())
-    def test_non_negative_float(self, network: UnscheduledProjectNetwork) -> None:
+    @staticmethod
+    def _check_non_negative_float(result: ScheduledProjectNetwork) -> None:
         """All activities should have non-negative total float."""
-        result = schedule(network)
-
         for activity in result.activities:
             assert activity.total_float.value >= 0, (
                 f"Activity {activity.name.value} has negative total_float: {activity.total_float}"
             )
 
-    @given(acyclic_project_networks())
-    def test_timing_order(self, network: UnscheduledProjectNetwork) -> None:
+    @staticmethod
+    def _check_timing_order(result: ScheduledProjectNetwork) -> None:
         """Earliest times should be <= latest times."""
-        result = schedule(network)
-
         for activity in result.activities:
             assert activity.earliest_start <= activity.latest_start, (
                 f"Activity {activity.name.value}: earliest_start {activity.earliest_start} "
@@ -125,10 +129,8 @@ class TestSchedulingProperties:
                 f"> latest_finish {activity.latest_finish}"
             )
 
-    @given(acyclic_project_networks())
-    def test_critical_path_exists(self, network: UnscheduledProjectNetwork) -> None:
+    @staticmethod
+    def _check_critical_path_exists(result: ScheduledProjectNetwork) -> None:
         """At least one activity should have zero float (be on critical path)."""
-        result = schedule(network)
-
         critical_activities = [a for a in result.activities if a.is_critical]
         assert len(critical_activities) > 0, "No critical path found"
@@ -1,12 +1,27 @@
 """Concrete correctness tests for CPM scheduling with hand-calculated expected values."""
 
+import functools
 from decimal import Decimal
+from operator import attrgetter
+from typing import NamedTuple
+
+import pytest
 
 from parade.domain.activity import ActivityName, DecimalConvertible, Duration, ScheduledActivity, UnscheduledActivity
-from parade.domain.project_network import UnscheduledProjectNetwork
+from parade.domain.project_network import ScheduledProjectNetwork, UnscheduledProjectNetwork
 from parade.domain.scheduling import schedule
 
 
+@functools.cache
+def as_duration(value: DecimalConvertible) -> Duration:
+    """Return the Duration for a value, building each distinct one only once.
+
+    The same handful of small numbers recur throughout the expected times, and
+    Duration is immutable, so equal values can share one instance.
+    """
+    return Duration(Decimal(value))
+
+
 def assert_times(
     activity: ScheduledActivity,
     *,
@@ -18,250 +33,210 @@ def assert_times(
     """Assert CPM timing values for an activity."""
     es, ef = early
     ls, lf = late
-    assert activity.earliest_start == Duration(Decimal(es))
-    assert activity.earliest_finish == Duration(Decimal(ef))
-    assert activity.latest_start == Duration(Decimal(ls))
-    assert activity.latest_finish == Duration(Decimal(lf))
+    assert activity.earliest_start == as_duration(es)
+    assert activity.earliest_finish == as_duration(ef)
+    assert activity.latest_start == as_duration(ls)
+    assert activity.latest_finish == as_duration(lf)
     assert activity.total_float.value == Decimal(float_val)
     assert activity.is_critical == critical
 
 
-class TestLinearChain:
-    """Test a simple linear chain: A(5) → B(3) → C(2)."""
-
-    def test_linear_chain_correctness(self) -> None:
-        """Test linear chain produces correct CPM values.
-
-        Expected:
-        - All activities critical (zero float)
-        - Project duration = 10
-        - A: ES=0, EF=5, LS=0, LF=5
-        - B: ES=5, EF=8, LS=5, LF=8
-        - C: ES=8, EF=10, LS=8, LF=10
-        """
-        activities = frozenset(
-            [
-                UnscheduledActivity(
-                    name=ActivityName("A"),
-                    duration=Duration(Decimal(5)),
-                    depends_on=frozenset(),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("B"),
-                    duration=Duration(Decimal(3)),
-                    depends_on=frozenset(["A"]),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("C"),
-                    duration=Duration(Decimal(2)),
-                    depends_on=frozenset(["B"]),
-                ),
-            ],
+# An activity as (name, duration, names it depends on)
+type ActivitySpec = tuple[str, int, tuple[str, ...]]
+
+# Expected CPM values as (name, (ES, EF), (LS, LF), total float, critical)
+type ExpectedTimes = tuple[str, tuple[int, int], tuple[int, int], int, bool]
+
+
+class GraphCase(NamedTuple):
+    """A small project network together with its hand-calculated schedule."""
+
+    id: str
+    activities: tuple[ActivitySpec, ...]
+    expected: tuple[ExpectedTimes, ...]
+    project_duration: int
+
+
+GRAPH_CASES = (
+    # A(5) → B(3) → C(2): every activity is critical
+    GraphCase(
+        id="linear_chain",
+        activities=(("A", 5, ()), ("B", 3, ("A",)), ("C", 2, ("B",))),
+        expected=(
+            ("A", (0, 5), (0, 5), 0, True),
+            ("B", (5, 8), (5, 8), 0, True),
+            ("C", (8, 10), (8, 10), 0, True),
+        ),
+        project_duration=10,
+    ),
+    # A(2) → B(5) | C(3) → D(1): path A→B→D = 8 is critical, A→C→D = 6 leaves C float
+    GraphCase(
+        id="diamond_unequal_paths",
+        activities=(("A", 2, ()), ("B", 5, ("A",)), ("C", 3, ("A",)), ("D", 1, ("B", "C"))),
+        expected=(
+            ("A", (0, 2), (0, 2), 0, True),
+            ("B", (2, 7), (2, 7), 0, True),
+            ("C", (2, 5), (4, 7), 2, False),
+            ("D", (7, 8), (7, 8), 0, True),
+        ),
+        project_duration=8,
+    ),
+    # A(2) → B(6) | C(6) → D(1): both paths are 9, so tied-longest paths are all critical
+    GraphCase(
+        id="multiple_critical_paths",
+        activities=(("A", 2, ()), ("B", 6, ("A",)), ("C", 6, ("A",)), ("D", 1, ("B", "C"))),
+        expected=(
+            ("A", (0, 2), (0, 2), 0, True),
+            ("B", (2, 8), (2, 8), 0, True),
+            ("C", (2, 8), (2, 8), 0, True),
+            ("D", (8, 9), (8, 9), 0, True),
+        ),
+        project_duration=9,
+    ),
+    # A(5) → B(3) and C(2) → D(4): chain A→B = 8 is critical, chain C→D = 6 has float 2
+    GraphCase(
+        id="disconnected_subgraphs",
+        activities=(("A", 5, ()), ("B", 3, ("A",)), ("C", 2, ()), ("D", 4, ("C",))),
+        expected=(
+            ("A", (0, 5), (0, 5), 0, True),
+            ("B", (5, 8), (5, 8), 0, True),
+            ("C", (0, 2), (2, 4), 2, False),
+            ("D", (2, 6), (4, 8), 2, False),
+        ),
+        project_duration=8,
+    ),
+)
+
+
+@pytest.fixture(scope="module", params=GRAPH_CASES, ids=attrgetter("id"))
+def scheduled_case(request: pytest.FixtureRequest) -> tuple[GraphCase, ScheduledProjectNetwork]:
+    """Schedule a hand-calculated graph once per module and share the result."""
+    case: GraphCase = request.param
+    activities = tuple(
+        UnscheduledActivity(
+            name=ActivityName(name),
+            duration=as_duration(duration),
+            depends_on=frozenset(depends_on),
         )
-        network = UnscheduledProjectNetwork(activities=activities)
-        result = schedule(network)
-
-        # Get activities by name
-        activities_by_name = {a.name: a for a in result.activities}
-        a = activities_by_name[ActivityName("A")]
-        b = activities_by_name[ActivityName("B")]
-        c = activities_by_name[ActivityName("C")]
-
-        assert_times(a, early=(0, 5), late=(0, 5))
-        assert_times(b, early=(5, 8), late=(5, 8))
-        assert_times(c, early=(8, 10), late=(8, 10))
-        assert result.project_duration == Duration(Decimal(10))
+        for name, duration, depends_on in case.activities
+    )
+    return case, schedule(UnscheduledProjectNetwork(activities=activities))
 
 
-class TestDiamondUnequalPaths:
-    """Test diamond with unequal paths.
+class TestHandCalculatedGraphs:
+    """Test small graphs against CPM values calculated by hand.
 
-         B(5)
-        ↗    ↘
-      A(2)    D(1)
-        ↘    ↗
-         C(3)
+    The diamonds fan out from A and join at D:
 
-    Path A→B→D = 8 (critical)
-    Path A→C→D = 6 (has float)
+         B
+        ↗ ↘
+      A     D
+        ↘ ↗
+         C
     """
 
-    def test_diamond_unequal_paths_correctness(self) -> None:
-        """Test diamond with unequal paths produces correct CPM values.
-
-        Expected:
-        - Critical path: A→B→D
-        - Project duration = 8
-        - A: ES=0, EF=2, LS=0, LF=2, float=0, critical
-        - B: ES=2, EF=7, LS=2, LF=7, float=0, critical
-        - C: ES=2, EF=5, LS=4, LF=7, float=2, NOT critical
-        - D: ES=7, EF=8, LS=7, LF=8, float=0, critical
-        """
-        activities = frozenset(
-            [
-                UnscheduledActivity(
-                    name=ActivityName("A"),
-                    duration=Duration(Decimal(2)),
-                    depends_on=frozenset(),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("B"),
-                    duration=Duration(Decimal(5)),
-                    depends_on=frozenset(["A"]),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("C"),
-                    duration=Duration(Decimal(3)),
-                    depends_on=frozenset(["A"]),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("D"),
-                    duration=Duration(Decimal(1)),
-                    depends_on=frozenset(["B", "C"]),
-                ),
-            ],
-        )
+    def test_activity_times_match_hand_calculation(
+        self,
+        scheduled_case: tuple[GraphCase, ScheduledProjectNetwork],
+    ) -> None:
+        """Test that every activity gets the expected times, float and criticality."""
+        case, result = scheduled_case
+
+        for name, early, late, float_val, critical in case.expected:
+            assert_times(
+                result.get(ActivityName.get(name)),
+                early=early,
+                late=late,
+                float_val=float_val,
+                critical=critical,
+            )
+
+    def test_project_duration_matches_hand_calculation(
+        self,
+        scheduled_case: tuple[GraphCase, ScheduledProjectNetwork],
+    ) -> None:
+        """Test that the project duration is the longest path through the graph."""
+        case, result = scheduled_case
+
+        assert result.project_duration == as_duration(case.project_duration)
+
+
+class TestLongChain:
+    """Test a chain deeper than the interpreter recursion limit, given in reverse order."""
+
+    def test_long_chain_correctness(self) -> None:
+        """Test that a 5000-step chain schedules end to end with every activity critical."""
+        chain_length = 5000
+        activities = [
+            UnscheduledActivity(
+                name=ActivityName(str(i)),
+                duration=as_duration(1),
+                depends_on=frozenset([str(i - 1)]) if i else frozenset(),
+            )
+            for i in reversed(range(chain_length))
+        ]
         network = UnscheduledProjectNetwork(activities=activities)
         result = schedule(network)
 
-        # Get activities by name
-        activities_by_name = {a.name: a for a in result.activities}
-        a = activities_by_name[ActivityName("A")]
-        b = activities_by_name[ActivityName("B")]
-        c = activities_by_name[ActivityName("C")]
-        d = activities_by_name[ActivityName("D")]
-
-        assert_times(a, early=(0, 2), late=(0, 2))
-        assert_times(b, early=(2, 7), late=(2, 7))
-        assert_times(c, early=(2, 5), late=(4, 7), float_val=2, critical=False)
-        assert_times(d, early=(7, 8), late=(7, 8))
-        assert result.project_duration == Duration(Decimal(8))
-
-
-class TestMultipleCriticalPaths:
-    """Test diamond with equal-length paths.
-
-         B(6)
-        ↗    ↘
-      A(2)    D(1)
-        ↘    ↗
-         C(6)
-
-    Both paths = 9, so all activities should be critical.
-    """
-
-    def test_multiple_critical_paths_correctness(self) -> None:
-        """Test that tied-longest paths are all marked critical.
-
-        Expected:
-        - Both paths critical: A→B→D = A→C→D = 9
-        - Project duration = 9
-        - All activities have zero float
-        - A: ES=0, EF=2, LS=0, LF=2
-        - B: ES=2, EF=8, LS=2, LF=8
-        - C: ES=2, EF=8, LS=2, LF=8
-        - D: ES=8, EF=9, LS=8, LF=9
-        """
-        activities = frozenset(
-            [
-                UnscheduledActivity(
-                    name=ActivityName("A"),
-                    duration=Duration(Decimal(2)),
-                    depends_on=frozenset(),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("B"),
-                    duration=Duration(Decimal(6)),
-                    depends_on=frozenset(["A"]),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("C"),
-                    duration=Duration(Decimal(6)),
-                    depends_on=frozenset(["A"]),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("D"),
-                    duration=Duration(Decimal(1)),
-                    depends_on=frozenset(["B", "C"]),
-                ),
-            ],
+        first = result.get(ActivityName.get("0"))
+        last = result.get(ActivityName.get(str(chain_length - 1)))
+
+        assert_times(first, early=(0, 1), late=(0, 1))
+        assert_times(last, early=(chain_length - 1, chain_length), late=(chain_length - 1, chain_length))
+        assert result.project_duration == as_duration(chain_length)
+
+
+class TestDecimalRepresentation:
+    """Test that computed times keep the exact Decimal form that Decimal arithmetic gives."""
+
+    @staticmethod
+    def _schedule_chain(*durations: str) -> list[ScheduledActivity]:
+        """Schedule a linear chain with the given durations and return it in chain order."""
+        activities = [
+            UnscheduledActivity(
+                name=ActivityName(str(i)),
+                duration=Duration(Decimal(duration)),
+                depends_on=frozenset([str(i - 1)]) if i else frozenset(),
+            )
+            for i, duration in enumerate(durations)
+        ]
+        result = schedule(UnscheduledProjectNetwork(activities=activities))
+        return [result.get(ActivityName.get(str(i))) for i in range(len(durations))]
+
+    @staticmethod
+    def _times(activity: ScheduledActivity) -> tuple[str, str, str, str]:
+        """Render an activity's computed times as strings."""
+        return (
+            str(activity.earliest_start.value),
+            str(activity.earliest_finish.value),
+            str(activity.latest_start.value),
+            str(activity.latest_finish.value),
         )
-        network = UnscheduledProjectNetwork(activities=activities)
-        result = schedule(network)
-
-        # Get activities by name
-        activities_by_name = {a.name: a for a in result.activities}
-        a = activities_by_name[ActivityName("A")]
-        b = activities_by_name[ActivityName("B")]
-        c = activities_by_name[ActivityName("C")]
-        d = activities_by_name[ActivityName("D")]
 
-        assert_times(a, early=(0, 2), late=(0, 2))
-        assert_times(b, early=(2, 8), late=(2, 8))
-        assert_times(c, early=(2, 8), late=(2, 8))
-        assert_times(d, early=(8, 9), late=(8, 9))
-        assert result.project_duration == Duration(Decimal(9))
+    def test_shared_exponent(self) -> None:
+        """Test that durations sharing an exponent keep it in every computed time."""
+        first, second = self._schedule_chain("1.50", "2.00")
 
+        assert self._times(first) == ("0", "1.50", "0.00", "1.50")
+        assert self._times(second) == ("1.50", "3.50", "1.50", "3.50")
 
-class TestDisconnectedSubgraphs:
-    """Test multiple independent chains.
+    def test_positive_exponent(self) -> None:
+        """Test that durations with a positive exponent produce plain integers."""
+        first, second = self._schedule_chain("1E+2", "2E+2")
 
-    A(5) → B(3)
+        assert self._times(first) == ("0", "100", "0", "100")
+        assert self._times(second) == ("100", "300", "100", "300")
 
-    C(2) → D(4)
+    def test_mixed_exponents(self) -> None:
+        """Test that durations with different exponents keep Decimal's per-operation exponents."""
+        first, second = self._schedule_chain("1.5", "2")
 
-    Chain A→B = 8 (critical)
-    Chain C→D = 6 (has float)
-    """
+        assert self._times(first) == ("0", "1.5", "0.0", "1.5")
+        assert self._times(second) == ("1.5", "3.5", "1.5", "3.5")
 
-    def test_disconnected_chains_correctness(self) -> None:
-        """Test disconnected subgraphs produce correct CPM values.
-
-        Expected:
-        - Project duration = 8 (max of both chains)
-        - A→B chain is critical
-        - C→D chain has float = 2
-        - A: ES=0, EF=5, LS=0, LF=5, float=0, critical
-        - B: ES=5, EF=8, LS=5, LF=8, float=0, critical
-        - C: ES=0, EF=2, LS=2, LF=4, float=2, NOT critical
-        - D: ES=2, EF=6, LS=4, LF=8, float=2, NOT critical
-        """
-        activities = frozenset(
-            [
-                UnscheduledActivity(
-                    name=ActivityName("A"),
-                    duration=Duration(Decimal(5)),
-                    depends_on=frozenset(),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("B"),
-                    duration=Duration(Decimal(3)),
-                    depends_on=frozenset(["A"]),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("C"),
-                    duration=Duration(Decimal(2)),
-                    depends_on=frozenset(),
-                ),
-                UnscheduledActivity(
-                    name=ActivityName("D"),
-                    duration=Duration(Decimal(4)),
-                    depends_on=frozenset(["C"]),
-                ),
-            ],
-        )
-        network = UnscheduledProjectNetwork(activities=activities)
-        result = schedule(network)
+    def test_totals_beyond_decimal_precision(self) -> None:
+        """Test that totals too large for exact Decimal arithmetic round as Decimal does."""
+        (only,) = self._schedule_chain("1E+30")
 
-        # Get activities by name
-        activities_by_name = {a.name: a for a in result.activities}
-        a = activities_by_name[ActivityName("A")]
-        b = activities_by_name[ActivityName("B")]
-        c = activities_by_name[ActivityName("C")]
-        d = activities_by_name[ActivityName("D")]
-
-        assert_times(a, early=(0, 5), late=(0, 5))
-        assert_times(b, early=(5, 8), late=(5, 8))
-        assert_times(c, early=(0, 2), late=(2, 4), float_val=2, critical=False)
-        assert_times(d, early=(2, 6), late=(4, 8), float_val=2, critical=False)
-        assert result.project_duration == Duration(Decimal(8))
+        expected = str(Decimal(0) + Decimal("1E+30"))
+        assert self._times(only) == ("0", expected, str(Decimal(expected) - Decimal("1E+30")), expected)
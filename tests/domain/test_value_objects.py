@@ -4,7 +4,16 @@ from decimal import Decimal
 
 import pytest
 
-from parade.domain.activity import ActivityName, Duration, Float
+from parade.domain.activity import ActivityName, Duration, Float, ScheduledActivity, UnscheduledActivity
+
+# Values Duration and Float reject, with the message each is rejected with
+INVALID_VALUES = [
+    ("-1.0", "Duration cannot be negative"),
+    ("NaN", "Duration cannot be NaN"),
+    ("Infinity", "Duration cannot be infinite"),
+    ("-Infinity", "Duration cannot be infinite"),
+]
+INVALID_VALUE_IDS = ["negative", "nan", "positive_infinity", "negative_infinity"]
 
 
 class TestActivityName:
@@ -25,6 +34,47 @@ class TestActivityName:
         with pytest.raises(ValueError, match="Activity name cannot be empty"):
             ActivityName("   ")
 
+    def test_get_returns_shared_activity_name(self) -> None:
+        """Test that ActivityName.get returns one validated instance per string."""
+        first = ActivityName.get("A")
+
+        assert first is ActivityName.get("A")
+        assert first == ActivityName("A")
+        with pytest.raises(ValueError, match="Activity name cannot be empty"):
+            ActivityName.get(" ")
+
+    def test_string_dependencies_share_activity_name_instances(self) -> None:
+        """Test that string dependency names are interned across activities."""
+        first = UnscheduledActivity(name=ActivityName("B"), duration=Duration(Decimal(1)), depends_on=frozenset({"A"}))
+        second = UnscheduledActivity(name=ActivityName("C"), duration=Duration(Decimal(1)), depends_on=frozenset({"A"}))
+
+        (first_dep,) = first.dependencies
+        (second_dep,) = second.dependencies
+        assert first_dep is second_dep
+        assert first_dep is ActivityName.get("A")
+
+    def test_value_objects_have_no_instance_dict(self) -> None:
+        """Test that activities and their value objects are slotted."""
+        activity = UnscheduledActivity(
+            name=ActivityName("B"), duration=Duration(Decimal(1)), depends_on=frozenset({"A"})
+        )
+
+        scheduled = ScheduledActivity.from_activity(
+            activity,
+            earliest_start=Duration(Decimal(0)),
+            earliest_finish=Duration(Decimal(1)),
+            latest_start=Duration(Decimal(0)),
+            latest_finish=Duration(Decimal(1)),
+        )
+
+        for value in (activity, scheduled, activity.name, activity.duration, scheduled.total_float):
+            assert not hasattr(value, "__dict__")
+
+    def test_empty_string_dependency_raises_error(self) -> None:
+        """Test that interning still validates dependency names."""
+        with pytest.raises(ValueError, match="Activity name cannot be empty"):
+            UnscheduledActivity(name=ActivityName("B"), duration=Duration(Decimal(1)), depends_on=frozenset({" "}))
+
 
 class TestDuration:
     """Tests for Duration value object."""
@@ -39,25 +89,11 @@ class TestDuration:
         duration = Duration(Decimal(0))
         assert duration.value == Decimal(0)
 
-    def test_negative_duration_raises_error(self) -> None:
-        """Test that negative duration raises ValueError."""
-        with pytest.raises(ValueError, match="Duration cannot be negative"):
-            Duration(Decimal("-1.0"))
-
-    def test_nan_duration_raises_error(self) -> None:
-        """Test that NaN duration raises ValueError."""
-        with pytest.raises(ValueError, match="Duration cannot be NaN"):
-            Duration(Decimal("NaN"))
-
-    def test_positive_infinity_duration_raises_error(self) -> None:
-        """Test that positive infinity duration raises ValueError."""
-        with pytest.raises(ValueError, match="Duration cannot be infinite"):
-            Duration(Decimal("Infinity"))
-
-    def test_negative_infinity_duration_raises_error(self) -> None:
-        """Test that negative infinity duration raises ValueError."""
-        with pytest.raises(ValueError, match="Duration cannot be infinite"):
-            Duration(Decimal("-Infinity"))
+    @pytest.mark.parametrize(("value", "message"), INVALID_VALUES, ids=INVALID_VALUE_IDS)
+    def test_invalid_duration_raises_error(self, value: str, message: str) -> None:
+        """Test that negative, NaN and infinite durations raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            Duration(Decimal(value))
 
     def test_duration_addition(self) -> None:
         """Test adding two durations."""
@@ -73,6 +109,11 @@ class TestDuration:
         result = d1 - d2
         assert result == Duration(Decimal("2.0"))
 
+    def test_duration_subtraction_below_zero_raises_error(self) -> None:
+        """Test that subtracting a larger duration raises ValueError."""
+        with pytest.raises(ValueError, match="Duration cannot be negative"):
+            Duration(Decimal("3.0")) - Duration(Decimal("5.0"))
+
     def test_duration_comparison(self) -> None:
         """Test comparing durations."""
         d1 = Duration(Decimal("5.0"))
@@ -94,25 +135,11 @@ class TestFloat:
         slack = Float(Decimal("2.0"))
         assert slack.value == Decimal("2.0")
 
-    def test_negative_float_raises_error(self) -> None:
-        """Test that negative float raises ValueError."""
-        with pytest.raises(ValueError, match="Duration cannot be negative"):
-            Float(Decimal("-1.0"))
-
-    def test_nan_float_raises_error(self) -> None:
-        """Test that NaN float raises ValueError."""
-        with pytest.raises(ValueError, match="Duration cannot be NaN"):
-            Float(Decimal("NaN"))
-
-    def test_positive_infinity_float_raises_error(self) -> None:
-        """Test that positive infinity float raises ValueError."""
-        with pytest.raises(ValueError, match="Duration cannot be infinite"):
-            Float(Decimal("Infinity"))
-
-    def test_negative_infinity_float_raises_error(self) -> None:
-        """Test that negative infinity float raises ValueError."""
-        with pytest.raises(ValueError, match="Duration cannot be infinite"):
-            Float(Decimal("-Infinity"))
+    @pytest.mark.parametrize(("value", "message"), INVALID_VALUES, ids=INVALID_VALUE_IDS)
+    def test_invalid_float_raises_error(self, value: str, message: str) -> None:
+        """Test that negative, NaN and infinite floats raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            Float(Decimal(value))
 
     def test_float_from_duration(self) -> None:
         """Test creating Float from Duration."""
@@ -13,14 +13,8 @@ def durations(draw: st.DrawFn) -> Duration:
 
     Generates positive finite Decimals that match domain constraints.
     Limits precision to 3 decimal places for performance and realistic test values.
+    The value is drawn as a whole number of thousandths and scaled at the end,
+    since Hypothesis generates and shrinks integers faster than Decimals.
     """
-    value = draw(
-        st.decimals(
-            min_value=Decimal("0.001"),
-            max_value=Decimal(10000),
-            allow_nan=False,
-            allow_infinity=False,
-            places=3,  # Limit precision for performance (without this, tests timeout)
-        ),
-    )
-    return Duration(value)
+    thousandths = draw(st.integers(min_value=1, max_value=10_000_000))
+    return Duration(Decimal(thousandths).scaleb(-3))